@@ -213,7 +213,7 @@ async def create_dashboard(request: DashboardRequest):
                 "chart_type": widget.chart_type,
                 "title": widget.title,
                 "description": widget.description,
-                "chart": json.loads(widget.figure.to_json())
+                "chart": widget.chart_json()
             })
         
         return sanitize_dict({
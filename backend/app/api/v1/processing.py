@@ -90,9 +90,9 @@ async def process_file(request: ProcessRequest, background_tasks: BackgroundTask
         
         # Convert DataFrames to serializable format
         serialized_dataframes = []
-        for idx, df in enumerate(result.dataframes):
+        for sheet_name, df in result.iter_sheets():
             serialized_dataframes.append({
-                "sheet_name": result.sheet_names[idx] if idx < len(result.sheet_names) else f"Sheet_{idx+1}",
+                "sheet_name": sheet_name,
                 "rows": len(df),
                 "columns": len(df.columns),
                 "column_names": df.columns.tolist(),
@@ -79,6 +79,9 @@ class Settings:
     PDF_MAX_PAGES: int = int(os.getenv("PDF_MAX_PAGES", "100"))
     IMAGE_MAX_WIDTH: int = int(os.getenv("IMAGE_MAX_WIDTH", "4096"))
     IMAGE_MAX_HEIGHT: int = int(os.getenv("IMAGE_MAX_HEIGHT", "4096"))
+    EXCEL_CHUNK_ROWS: int = int(os.getenv("EXCEL_CHUNK_ROWS", "200000"))
+    ZIP_MAX_UNCOMPRESSED_SIZE: int = int(os.getenv("ZIP_MAX_UNCOMPRESSED_SIZE", "524288000"))  # 500MB default
+    ZIP_MAX_COMPRESSION_RATIO: int = int(os.getenv("ZIP_MAX_COMPRESSION_RATIO", "100"))
     
     @property
     def IMAGE_MAX_SIZE(self) -> tuple:
@@ -95,6 +98,7 @@ class Settings:
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "dev-jwt-secret-change-in-production")
     JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
     JWT_EXPIRATION_MINUTES: int = int(os.getenv("JWT_EXPIRATION_MINUTES", "30"))
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
     GOOGLE_CLIENT_ID: str = os.getenv("GOOGLE_CLIENT_ID", "")
     
     # ==================== Logging ====================
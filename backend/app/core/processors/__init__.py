@@ -26,6 +26,25 @@ __all__ = [
 ]
 
 
+# Extension (without dot) -> processor class
+PROCESSOR_MAP = {
+    'pdf': PDFProcessor,
+    'xlsx': ExcelProcessor,
+    'xlsm': ExcelProcessor,
+    'xls': ExcelProcessor,
+    'csv': CSVProcessor,
+    'txt': TextProcessor,
+    'tsv': CSVProcessor,
+    'docx': DOCXProcessor,
+    'doc': DOCXProcessor,
+    'png': ImageProcessor,
+    'jpg': ImageProcessor,
+    'jpeg': ImageProcessor,
+    'webp': ImageProcessor,
+    'zip': ZipProcessor,
+}
+
+
 # Factory function to get appropriate processor
 def get_processor(file_extension: str) -> BaseProcessor:
     """
@@ -42,29 +61,12 @@ def get_processor(file_extension: str) -> BaseProcessor:
     """
     extension = file_extension.lower().strip().lstrip('.')
     
-    processor_map = {
-        'pdf': PDFProcessor,
-        'xlsx': ExcelProcessor,
-        'xlsm': ExcelProcessor,
-        'xls': ExcelProcessor,
-        'csv': CSVProcessor,
-        'txt': TextProcessor,
-        'tsv': CSVProcessor,
-        'docx': DOCXProcessor,
-        'doc': DOCXProcessor,
-        'png': ImageProcessor,
-        'jpg': ImageProcessor,
-        'jpeg': ImageProcessor,
-        'webp': ImageProcessor,
-        'zip': ZipProcessor,
-    }
-    
-    processor_class = processor_map.get(extension)
+    processor_class = PROCESSOR_MAP.get(extension)
     
     if processor_class is None:
         raise ValueError(
             f"Unsupported file extension: {extension}. "
-            f"Supported formats: {', '.join(processor_map.keys())}"
+            f"Supported formats: {', '.join(PROCESSOR_MAP.keys())}"
         )
     
     return processor_class()
\ No newline at end of file
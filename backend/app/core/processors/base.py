@@ -4,14 +4,153 @@ Base Processor - Abstract base class for all file processors
 #backend/app/core/processors/base.py
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator, Tuple
 from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+import os
+import re
+import threading
 import pandas as pd
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Bounded worker pool shared by all processors (created on first use)
+PROCESSOR_POOL_WORKERS = 4
+_POOL_THREAD_PREFIX = "processor"
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_thread_pool_lock = threading.Lock()
+
+# Process pool for CPU-bound pure-Python work that threads can't speed up (created on first use)
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+_in_pool_process = False
+
+# Three consecutive non-blank lines that each contain a table delimiter, the
+# least any block accepted by extract_tables_from_text must have
+_TABLE_CANDIDATE = re.compile(
+    r'[\t|,;][^\n]*(?:\n[^\S\n]+)*\n[^\n\t|,;]*[\t|,;][^\n]*(?:\n[^\S\n]+)*\n[^\n\t|,;]*[\t|,;]'
+)
+
+# Date pattern heuristic (e.g., YYYY-MM-DD, DD/MM/YYYY, etc.)
+_DATE_PATTERN = re.compile(r'(\d{1,4})[/-]\d{1,2}[/-]\d{1,4}')
+
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """
+    Get the process-wide thread pool used for parallel per-item work
+    
+    Returns:
+        Shared ThreadPoolExecutor
+    """
+    global _thread_pool
+    
+    if _thread_pool is None:
+        with _thread_pool_lock:
+            if _thread_pool is None:
+                _thread_pool = ThreadPoolExecutor(
+                    max_workers=PROCESSOR_POOL_WORKERS,
+                    thread_name_prefix=_POOL_THREAD_PREFIX
+                )
+    return _thread_pool
+
+
+def run_in_pool(func: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+    """
+    Map a function over items on the shared pool, preserving order
+    
+    Runs inline when there is nothing to parallelize or when already on a
+    pool thread, so nested parallel sections can never starve the pool.
+    
+    Args:
+        func: Function applied to each item
+        items: Items to process
+    
+    Returns:
+        List of results in input order
+    """
+    items = list(items)
+    if len(items) < 2 or threading.current_thread().name.startswith(_POOL_THREAD_PREFIX):
+        return [func(item) for item in items]
+    return list(get_thread_pool().map(func, items))
+
+
+def iter_in_pool(func: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[Any]:
+    """
+    Like run_in_pool, but yield each result in input order as soon as it is ready
+    
+    All items are submitted up front, so the caller can consume the first
+    results while later ones are still being computed.
+    
+    Args:
+        func: Function applied to each item
+        items: Items to process
+    
+    Yields:
+        Results in input order
+    """
+    items = list(items)
+    if len(items) < 2 or threading.current_thread().name.startswith(_POOL_THREAD_PREFIX):
+        for item in items:
+            yield func(item)
+        return
+    
+    pool = get_thread_pool()
+    futures = [pool.submit(func, item) for item in items]
+    for future in futures:
+        yield future.result()
+
+
+def _mark_pool_process():
+    """Initializer for process pool workers"""
+    global _in_pool_process
+    _in_pool_process = True
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the process-wide pool used for CPU-bound pure-Python work
+    
+    Workers are spawned rather than forked, so a pool started from a
+    threaded server never inherits locks held by other threads.
+    
+    Returns:
+        Shared ProcessPoolExecutor
+    """
+    global _process_pool
+    
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=PROCESSOR_POOL_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_mark_pool_process
+                )
+    return _process_pool
+
+
+def run_in_process_pool(func: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+    """
+    Map a module-level function over picklable items on the shared process pool
+    
+    Runs inline when there is nothing to parallelize, on a single-CPU host,
+    or when already inside a pool worker process.
+    
+    Args:
+        func: Module-level function applied to each item
+        items: Items to process
+    
+    Returns:
+        List of results in input order
+    """
+    items = list(items)
+    if len(items) < 2 or _in_pool_process or (os.cpu_count() or 1) < 2:
+        return [func(item) for item in items]
+    return list(get_process_pool().map(func, items))
+
 
 @dataclass
 class ProcessingResult:
@@ -22,7 +161,9 @@ class ProcessingResult:
     file_path: str
     file_type: str
     
-    # Extracted data
+    # Extracted data (pyarrow.Table entries when a processor is called with lazy=True;
+    # a Table's .columns is a list of ChunkedArrays, so use iter_sheets(), which
+    # materializes them with .to_pandas(), wherever DataFrames are expected)
     dataframes: List[pd.DataFrame] = field(default_factory=list)
     text_content: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -49,6 +190,22 @@ class ProcessingResult:
             
             if not self.sheet_names:
                 self.sheet_names = [f"Sheet_{i+1}" for i in range(len(self.dataframes))]
+    
+    def iter_sheets(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Iterate over (sheet name, dataframe) pairs
+        
+        Lazy (pyarrow.Table) entries are converted with .to_pandas() one at a
+        time, so only the sheet being consumed is materialized.
+        
+        Yields:
+            Sheet name (Sheet_N when none was recorded) and its dataframe
+        """
+        for idx, df in enumerate(self.dataframes):
+            sheet_name = self.sheet_names[idx] if idx < len(self.sheet_names) else f"Sheet_{idx+1}"
+            if not isinstance(df, pd.DataFrame) and hasattr(df, 'to_pandas'):
+                df = df.to_pandas()
+            yield sheet_name, df
 
 
 class BaseProcessor(ABC):
@@ -198,12 +355,8 @@ class BaseProcessor(ABC):
         Returns:
             DataFrame with inferred types
         """
-        import re
         import warnings
         
-        # Date pattern heuristic (e.g., YYYY-MM-DD, DD/MM/YYYY, etc.)
-        date_pattern = re.compile(r'(\d{1,4})[/-]\d{1,2}[/-]\d{1,4}')
-        
         for col in df.columns:
             # Skip if already numeric or complex type
             if not df[col].dtype == 'object':
@@ -226,7 +379,7 @@ class BaseProcessor(ABC):
                     sample = df[col].dropna().head(20)
                     if len(sample) > 0:
                         # Only attempt if at least one sample matches date pattern
-                        if any(date_pattern.search(str(s)) for s in sample):
+                        if any(_DATE_PATTERN.search(str(s)) for s in sample):
                             # Suppress the dateutil parsing warning as we're intentionally
                             # allowing flexible date parsing
                             with warnings.catch_warnings():
@@ -245,70 +398,83 @@ class BaseProcessor(ABC):
         """
         dataframes = []
         
+        # Most OCR output and plain text is prose; one regex scan rules it out
+        # before any block is split or parsed
+        if not _TABLE_CANDIDATE.search(text):
+            return dataframes
+        
         # Split by double newlines (potential table boundaries)
         blocks = text.split('\n\n')
         
         for block in blocks:
-            lines = [line.strip() for line in block.split('\n') if line.strip()]
+            lines = [line for line in map(str.strip, block.split('\n')) if line]
             
             # HEURISTIC 1: Minimum rows (at least 3: header + 2 data rows)
             if len(lines) < 3:
                 continue
             
+            # Block-level heuristics don't depend on the delimiter, so they are
+            # computed once and checked before the (slow) python-engine parse
+            
+            # HEURISTIC 6: Row Length Consistency (CV)
+            line_lens = pd.Series([len(line) for line in lines])
+            mean_len = line_lens.mean()
+            cv = line_lens.std() / mean_len if mean_len > 0 else 1.0
+            
+            # HEURISTIC 7: Trailing Punctuation (Sentences usually end with periods)
+            ends_with_period = sum(1 for line in lines if line.endswith('.'))
+            period_ratio = ends_with_period / len(lines)
+            
+            # - Consistency CV < 0.3 (Tables are very uniform)
+            # - Period Ratio < 0.5 (Tables don't usually end with periods on every row)
+            if not (cv < 0.3 and period_ratio < 0.5):
+                continue
+            
+            total_chars = sum(len(line.replace(' ', '')) for line in lines)
+            
             # Check if lines have consistent delimiters
             for delimiter in ['\t', '|', ',', ';']:
                 # Count occurances in each line
                 counts = [line.count(delimiter) for line in lines]
                 
                 # HEURISTIC 2: Minimum columns (at least 1 delimiter for 2 columns)
-                if all(count >= 1 for count in counts):
-                    # HEURISTIC 3: Structural Consistency
-                    # Most lines should have the exact same number of delimiters
-                    most_common_count = max(set(counts), key=counts.count)
-                    consistency = counts.count(most_common_count) / len(counts)
+                if not all(count >= 1 for count in counts):
+                    continue
+                
+                # HEURISTIC 3: Structural Consistency
+                # Most lines should have the exact same number of delimiters
+                most_common_count = max(set(counts), key=counts.count)
+                consistency = counts.count(most_common_count) / len(counts)
+                if consistency < 0.7: # 70% of rows must match the common structure
+                    continue
+                
+                # HEURISTIC 5: Delimiter vs Text Ratio
+                # In a table, delimiters should be fairly frequent compared to non-space text.
+                # - Chars/Delim < 20 (Tables have high delimiter density)
+                total_delimiters = sum(counts)
+                chars_per_delimiter = total_chars / total_delimiters if total_delimiters > 0 else 999
+                if chars_per_delimiter >= 20:
+                    continue
+                
+                try:
+                    from io import StringIO
+                    df = pd.read_csv(
+                        StringIO('\n'.join(lines)),
+                        sep=delimiter,
+                        engine='python',
+                        on_bad_lines='skip'
+                    )
                     
-                    if consistency >= 0.7: # 70% of rows must match the common structure
-                        try:
-                            from io import StringIO
-                            df = pd.read_csv(
-                                StringIO('\n'.join(lines)),
-                                sep=delimiter,
-                                engine='python',
-                                on_bad_lines='skip'
-                            )
-                            
-                            # HEURISTIC 4: Density check
-                            # Tables usually have short cells. If average cell length is too high, it might be text.
-                            avg_cell_len = df.astype(str).map(len).values.mean()
-                            
-                            # HEURISTIC 5: Delimiter vs Text Ratio
-                            # In a table, delimiters should be fairly frequent compared to non-space text.
-                            total_chars = sum(len(line.replace(' ', '')) for line in lines)
-                            total_delimiters = sum(counts)
-                            chars_per_delimiter = total_chars / total_delimiters if total_delimiters > 0 else 999
-                            
-                            # HEURISTIC 6: Row Length Consistency (CV)
-                            line_lens = [len(line) for line in lines]
-                            std_dev = pd.Series(line_lens).std()
-                            mean_len = pd.Series(line_lens).mean()
-                            cv = std_dev / mean_len if mean_len > 0 else 1.0
-
-                            # HEURISTIC 7: Trailing Punctuation (Sentences usually end with periods)
-                            ends_with_period = sum(1 for line in lines if line.strip().endswith('.'))
-                            period_ratio = ends_with_period / len(lines)
-
-                            # Strict check: 
-                            # - Avg Cell < 40 (Tables have short cells)
-                            # - Chars/Delim < 15 (Tables have high delimiter density)
-                            # - Consistency CV < 0.3 (Tables are very uniform)
-                            # - Period Ratio < 0.5 (Tables don't usually end with periods on every row)
-                            if (len(df.columns) > 1 and len(df) >= 2 and 
-                                avg_cell_len < 40 and chars_per_delimiter < 20 and 
-                                cv < 0.3 and period_ratio < 0.5):
-                                dataframes.append(self.clean_dataframe(df))
-                                break
-                        except:
-                            continue
+                    # HEURISTIC 4: Density check
+                    # Tables usually have short cells. If average cell length is too high, it might be text.
+                    # - Avg Cell < 40 (Tables have short cells)
+                    avg_cell_len = df.astype(str).map(len).values.mean()
+                    
+                    if len(df.columns) > 1 and len(df) >= 2 and avg_cell_len < 40:
+                        dataframes.append(self.clean_dataframe(df))
+                        break
+                except:
+                    continue
         
         return dataframes
     
@@ -5,16 +5,135 @@ Supports .docx format (Office Open XML)
 #backend/app/core/processors/docx_processor.py
 
 
+import os
+import re
 import time
-from typing import List, Dict, Any
+import zipfile
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional
 import pandas as pd
 import logging
 
-from .base import BaseProcessor, ProcessingResult
+from .base import BaseProcessor, ProcessingResult, run_in_pool
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# WordprocessingML namespace and the tags that carry paragraph text
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_W_BODY = f'{{{W_NS}}}body'
+_W_P = f'{{{W_NS}}}p'
+_W_R = f'{{{W_NS}}}r'
+_W_HYPERLINK = f'{{{W_NS}}}hyperlink'
+_W_T = f'{{{W_NS}}}t'
+_W_TAB = f'{{{W_NS}}}tab'
+_W_PTAB = f'{{{W_NS}}}ptab'
+_W_BR = f'{{{W_NS}}}br'
+_W_CR = f'{{{W_NS}}}cr'
+_W_NO_BREAK_HYPHEN = f'{{{W_NS}}}noBreakHyphen'
+_W_TYPE = f'{{{W_NS}}}type'
+_W_TBL = f'{{{W_NS}}}tbl'
+_W_TR = f'{{{W_NS}}}tr'
+_W_TC = f'{{{W_NS}}}tc'
+_W_GRID_SPAN = f'{{{W_NS}}}tcPr/{{{W_NS}}}gridSpan'
+_W_V_MERGE = f'{{{W_NS}}}tcPr/{{{W_NS}}}vMerge'
+_W_VAL = f'{{{W_NS}}}val'
+
+# Numeric cell check without float()'s exception path (thousands separators allowed)
+_NUM_RE = re.compile(r'^[-+]?(?:\d[\d,]*(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?$')
+_NUM_START = frozenset('0123456789-+.')
+
+# Whitespace-delimited word, same split as str.split()
+_WORD_RE = re.compile(r'\S+')
+
+# Convert tables on the shared pool only when there are enough to pay for it
+PARALLEL_TABLE_THRESHOLD = 4
+
+# docProps/core.xml fields, in the shape python-docx's core_properties exposes them
+_CP_NS = 'http://schemas.openxmlformats.org/package/2006/metadata/core-properties'
+_DC_NS = 'http://purl.org/dc/elements/1.1/'
+_DCTERMS_NS = 'http://purl.org/dc/terms/'
+_CORE_TEXT_PROPS = {
+    'author': f'{{{_DC_NS}}}creator',
+    'title': f'{{{_DC_NS}}}title',
+    'subject': f'{{{_DC_NS}}}subject',
+    'keywords': f'{{{_CP_NS}}}keywords',
+    'comments': f'{{{_DC_NS}}}description',
+    'last_modified_by': f'{{{_CP_NS}}}lastModifiedBy',
+}
+_CORE_DATE_PROPS = {
+    'created': f'{{{_DCTERMS_NS}}}created',
+    'modified': f'{{{_DCTERMS_NS}}}modified',
+}
+_CORE_REVISION = f'{{{_CP_NS}}}revision'
+
+
+def _run_text(r) -> str:
+    """Text of a <w:r> element, mapping its children like python-docx's CT_R.text"""
+    parts = []
+    for node in r.iterchildren(_W_T, _W_TAB, _W_PTAB, _W_BR, _W_CR, _W_NO_BREAK_HYPHEN):
+        tag = node.tag
+        if tag == _W_T:
+            parts.append(node.text or '')
+        elif tag == _W_TAB or tag == _W_PTAB:
+            parts.append('\t')
+        elif tag == _W_CR:
+            parts.append('\n')
+        elif tag == _W_NO_BREAK_HYPHEN:
+            parts.append('-')
+        elif node.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+            # Page and column breaks contribute no text
+            parts.append('\n')
+    return ''.join(parts)
+
+
+def _paragraph_text(p) -> str:
+    """Concatenate the text of a <w:p> element the way python-docx does
+
+    Only direct runs and runs inside direct hyperlinks count, so text in
+    textboxes, tracked insertions and smart tags is skipped as in Paragraph.text.
+    """
+    parts = []
+    for child in p.iterchildren(_W_R, _W_HYPERLINK):
+        if child.tag == _W_R:
+            parts.append(_run_text(child))
+        else:
+            parts.extend(_run_text(r) for r in child.iterchildren(_W_R))
+    return ''.join(parts)
+
+
+def _table_rows(tbl) -> List[List[str]]:
+    """Read a <w:tbl> element into a list of stripped cell-text rows"""
+    rows = []
+    # Text last seen in each grid column, for vertically merged cells
+    above: Dict[int, str] = {}
+    for tr in tbl.iterchildren(_W_TR):
+        row = []
+        for tc in tr.iterchildren(_W_TC):
+            # Horizontally merged cells span several grid columns
+            span = tc.find(_W_GRID_SPAN)
+            width = int(span.get(_W_VAL, 1)) if span is not None else 1
+            col = len(row)
+            v_merge = tc.find(_W_V_MERGE)
+            if v_merge is not None and v_merge.get(_W_VAL, 'continue') != 'restart':
+                # Continuation of a vertical merge repeats the top cell, like row.cells
+                row.extend(above.get(col + i, '') for i in range(width))
+            else:
+                text = '\n'.join(_paragraph_text(p) for p in tc.iterchildren(_W_P)).strip()
+                row.extend([text] * width)
+            for i in range(col, len(row)):
+                above[i] = row[i]
+        rows.append(row)
+    return rows
+
+
+@lru_cache(maxsize=8)
+def _load_document(file_path: str, mtime_ns: int, size: int):
+    """Parse a DOCX once per (path, mtime, size); shared by the read-only helpers"""
+    from docx import Document
+    return Document(file_path)
+
 
 class DOCXProcessor(BaseProcessor):
     """Process Word documents and extract text and tables"""
@@ -50,35 +169,43 @@ class DOCXProcessor(BaseProcessor):
             extract_tables = kwargs.get('extract_tables', True)
             include_formatting = kwargs.get('include_formatting', False)
             
-            # Import python-docx
-            from docx import Document
-            
-            # Load document
-            doc = Document(file_path)
-            
             # Extract content
             text_content = ""
-            dataframes = []
             warnings = []
             
-            if extract_text:
-                text_content = self._extract_text(doc, include_formatting)
-            
-            if extract_tables:
-                tables = self._extract_tables(doc)
+            if include_formatting:
+                # Style names need the full python-docx object model
+                from docx import Document
+                doc = Document(file_path)
+                
+                if extract_text:
+                    text_content = self._extract_text(doc, include_formatting)
                 
-                for i, table_df in enumerate(tables):
-                    if not table_df.empty:
-                        cleaned_df = self.clean_dataframe(table_df)
-                        dataframes.append(cleaned_df)
+                raw_tables = [
+                    _table_rows(tbl) for tbl in doc.element.body.iterchildren(_W_TBL)
+                ] if extract_tables else []
+                
+                # Extract document metadata
+                metadata.update(self._extract_document_metadata(doc))
+                
+                # Add document statistics
+                metadata['paragraph_count'] = len(doc.paragraphs)
+                metadata['table_count'] = len(doc.tables)
             
-            # Extract document metadata
-            doc_metadata = self._extract_document_metadata(doc)
-            metadata.update(doc_metadata)
+            else:
+                # Stream document.xml so only one paragraph/table is held at a time
+                streamed = self._stream_document(file_path, extract_text, extract_tables)
+                
+                if extract_text:
+                    text_content = "\n".join(streamed['paragraphs'])
+                
+                raw_tables = streamed['tables']
+                
+                metadata.update(streamed['metadata'])
+                metadata['paragraph_count'] = streamed['paragraph_count']
+                metadata['table_count'] = streamed['table_count']
             
-            # Add document statistics
-            metadata['paragraph_count'] = len(doc.paragraphs)
-            metadata['table_count'] = len(doc.tables)
+            dataframes = self._tables_to_dataframes(raw_tables)
             
             # Create result
             result = ProcessingResult(
@@ -117,18 +244,21 @@ class DOCXProcessor(BaseProcessor):
         Returns:
             Extracted text
         """
-        text_parts = []
-        
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                if include_formatting:
+        if include_formatting:
+            text_parts = []
+            
+            for paragraph in doc.paragraphs:
+                if paragraph.text.strip():
                     # Include style information
                     style = paragraph.style.name if paragraph.style else "Normal"
                     text_parts.append(f"[{style}] {paragraph.text}")
-                else:
-                    text_parts.append(paragraph.text)
+            
+            return "\n".join(text_parts)
         
-        return "\n".join(text_parts)
+        # Plain text: read body-level <w:p> elements straight from the XML tree,
+        # skipping python-docx's Paragraph/Run wrapper objects
+        texts = [_paragraph_text(p) for p in doc.element.body.iterchildren(_W_P)]
+        return "\n".join(text for text in texts if text.strip())
     
     def _extract_tables(self, doc) -> List[pd.DataFrame]:
         """
@@ -142,27 +272,152 @@ class DOCXProcessor(BaseProcessor):
         """
         dataframes = []
         
-        for table in doc.tables:
-            # Extract table data
-            data = []
-            
-            for row in table.rows:
-                row_data = []
-                for cell in row.cells:
-                    row_data.append(cell.text.strip())
-                data.append(row_data)
-            
-            if data and len(data) > 1:
-                # Use first row as header if it looks like a header
-                if self._is_likely_header(data[0], data[1:]):
-                    df = pd.DataFrame(data[1:], columns=data[0])
-                else:
-                    df = pd.DataFrame(data)
-                
+        for tbl in doc.element.body.iterchildren(_W_TBL):
+            # Extract table data straight from the XML, no _Row/_Cell wrappers
+            df = self._rows_to_df(_table_rows(tbl))
+            if df is not None:
                 dataframes.append(df)
         
         return dataframes
     
+    def _rows_to_df(self, data: List[List[str]]) -> Optional[pd.DataFrame]:
+        """
+        Build a DataFrame from raw table rows
+        
+        Args:
+            data: Table rows as lists of cell text
+        
+        Returns:
+            DataFrame, or None if the table has no data rows
+        """
+        if not data or len(data) < 2:
+            return None
+        
+        # Use first row as header if it looks like a header
+        if self._is_likely_header(data[0], data[1:]):
+            return pd.DataFrame(data[1:], columns=data[0])
+        return pd.DataFrame(data)
+    
+    def _table_to_df(self, data: List[List[str]]) -> Optional[pd.DataFrame]:
+        """Build and clean one table; None if it has no usable data"""
+        df = self._rows_to_df(data)
+        if df is None or df.empty:
+            return None
+        return self.clean_dataframe(df)
+    
+    def _tables_to_dataframes(self, raw_tables: List[List[List[str]]]) -> List[pd.DataFrame]:
+        """
+        Convert raw table rows to cleaned DataFrames, in parallel for many tables
+        
+        Args:
+            raw_tables: Tables as lists of cell-text rows
+        
+        Returns:
+            Cleaned, non-empty DataFrames in document order
+        """
+        if len(raw_tables) >= PARALLEL_TABLE_THRESHOLD:
+            results = run_in_pool(self._table_to_df, raw_tables)
+        else:
+            results = [self._table_to_df(data) for data in raw_tables]
+        
+        return [df for df in results if df is not None]
+    
+    def _stream_document(
+        self,
+        file_path: str,
+        extract_text: bool = True,
+        extract_tables: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Stream body paragraphs and tables out of word/document.xml
+        
+        Args:
+            file_path: Path to DOCX file
+            extract_text: Whether to collect paragraph text
+            extract_tables: Whether to collect table rows
+        
+        Returns:
+            Dictionary with paragraphs, tables (raw rows), counts and core metadata
+        """
+        from lxml import etree
+        
+        paragraphs = []
+        tables = []
+        paragraph_count = 0
+        table_count = 0
+        
+        with zipfile.ZipFile(file_path) as zf:
+            with zf.open('word/document.xml') as stream:
+                for _, elem in etree.iterparse(stream, events=('end',), tag=(_W_P, _W_TBL)):
+                    parent = elem.getparent()
+                    if parent is None or parent.tag != _W_BODY:
+                        # Nested content is read together with its enclosing table
+                        continue
+                    
+                    if elem.tag == _W_P:
+                        paragraph_count += 1
+                        if extract_text:
+                            text = _paragraph_text(elem)
+                            if text.strip():
+                                paragraphs.append(text)
+                    else:
+                        table_count += 1
+                        if extract_tables:
+                            tables.append(_table_rows(elem))
+                    
+                    # Release the finished element and everything parsed before it
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del parent[0]
+            
+            metadata = self._read_core_properties(zf)
+        
+        return {
+            'paragraphs': paragraphs,
+            'tables': tables,
+            'paragraph_count': paragraph_count,
+            'table_count': table_count,
+            'metadata': metadata,
+        }
+    
+    def _read_core_properties(self, zf: zipfile.ZipFile) -> Dict[str, Any]:
+        """
+        Read document properties from docProps/core.xml
+        
+        Args:
+            zf: Open DOCX archive
+        
+        Returns:
+            Dictionary with metadata (same keys as _extract_document_metadata)
+        """
+        metadata = {}
+        
+        try:
+            from lxml import etree
+            
+            root = etree.fromstring(zf.read('docProps/core.xml'))
+            
+            for key, tag in _CORE_TEXT_PROPS.items():
+                metadata[key] = root.findtext(tag) or ''
+            
+            for key, tag in _CORE_DATE_PROPS.items():
+                value = root.findtext(tag)
+                metadata[key] = None
+                if value:
+                    # Naive UTC, matching python-docx's core_properties datetimes
+                    stamp = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+                    if stamp.tzinfo is not None:
+                        stamp = stamp.astimezone(timezone.utc).replace(tzinfo=None)
+                    metadata[key] = str(stamp)
+            
+            revision = (root.findtext(_CORE_REVISION) or '').strip()
+            metadata['revision'] = int(revision) if revision.isdigit() else 0
+        
+        except Exception as e:
+            self.logger.warning(f"Could not extract document metadata: {str(e)}")
+        
+        return metadata
+    
     def _is_likely_header(
         self,
         first_row: List[str],
@@ -186,36 +441,29 @@ class DOCXProcessor(BaseProcessor):
         if not remaining_rows:
             return True
         
-        first_row_is_text = all(
-            not self._is_number(cell) for cell in first_row if cell
-        )
+        is_number = self._is_number
         
-        # Heuristic: headers often have shorter strings and fewer blanks than body rows
-        avg_head_len = sum(len(str(c)) for c in first_row) / len(first_row) if first_row else 0
+        first_row_is_text = not any(is_number(cell) for cell in first_row if cell)
+        if not first_row_is_text:
+            return False
         
-        body_stats = []
-        for row in remaining_rows[:5]: # Check first 5 rows
-            avg_len = sum(len(str(c)) for c in row) / len(row) if row else 0
-            blanks = sum(1 for c in row if not str(c).strip())
-            body_stats.append((avg_len, blanks))
-            
-        other_rows_have_numbers = any(
-            any(self._is_number(cell) for cell in row)
-            for row in remaining_rows
-        )
+        # Heuristic: headers often have shorter strings than body rows (first 5 rows)
+        avg_head_len = sum(len(str(c)) for c in first_row) / len(first_row) if first_row else 0
+        threshold = avg_head_len / 0.8
         
-        # If headers are shorter on average and body has numbers, it's likely a header
-        is_shorter = any(avg_head_len < stats[0] * 0.8 for stats in body_stats) if body_stats else False
+        for row in remaining_rows[:5]:
+            if row and sum(len(str(c)) for c in row) / len(row) > threshold:
+                return True
         
-        return first_row_is_text and (other_rows_have_numbers or is_shorter)
+        # Otherwise it's a header only if the body has numbers
+        return any(is_number(cell) for row in remaining_rows for cell in row)
     
     def _is_number(self, s: str) -> bool:
         """Check if string represents a number"""
-        try:
-            float(s.replace(',', ''))
-            return True
-        except (ValueError, AttributeError):
+        # Most text cells are rejected on their first character without touching the regex
+        if not s or not isinstance(s, str) or s[0] not in _NUM_START:
             return False
+        return _NUM_RE.match(s) is not None
     
     def _extract_document_metadata(self, doc) -> Dict[str, Any]:
         """
@@ -247,6 +495,19 @@ class DOCXProcessor(BaseProcessor):
         
         return metadata
     
+    def _load(self, file_path: str):
+        """
+        Load a python-docx Document, reusing a recent parse of the same file
+        
+        Args:
+            file_path: Path to DOCX file
+        
+        Returns:
+            python-docx Document object (treat as read-only)
+        """
+        stat = os.stat(file_path)
+        return _load_document(file_path, stat.st_mtime_ns, stat.st_size)
+    
     def extract_headings(self, file_path: str) -> List[Dict[str, Any]]:
         """
         Extract document structure (headings)
@@ -258,8 +519,7 @@ class DOCXProcessor(BaseProcessor):
             List of headings with their levels and text
         """
         try:
-            from docx import Document
-            doc = Document(file_path)
+            doc = self._load(file_path)
             
             headings = []
             
@@ -289,8 +549,7 @@ class DOCXProcessor(BaseProcessor):
             List of image information
         """
         try:
-            from docx import Document
-            doc = Document(file_path)
+            doc = self._load(file_path)
             
             images_info = []
             
@@ -318,20 +577,15 @@ class DOCXProcessor(BaseProcessor):
             Dictionary with statistics
         """
         try:
-            from docx import Document
-            doc = Document(file_path)
+            doc = self._load(file_path)
             
-            # Count words
-            total_words = 0
-            total_chars = 0
-            
-            for paragraph in doc.paragraphs:
-                text = paragraph.text
-                total_words += len(text.split())
-                total_chars += len(text)
+            # Count words in one regex scan over the whole body text
+            texts = [_paragraph_text(p) for p in doc.element.body.iterchildren(_W_P)]
+            total_words = len(_WORD_RE.findall("\n".join(texts)))
+            total_chars = sum(map(len, texts))
             
             return {
-                'paragraph_count': len(doc.paragraphs),
+                'paragraph_count': len(texts),
                 'table_count': len(doc.tables),
                 'word_count': total_words,
                 'character_count': total_chars,
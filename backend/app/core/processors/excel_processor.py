@@ -5,23 +5,127 @@ Supports multiple sheets, formulas, and formatting
 #backend/app/core/processors/excel_processor.py
 
 
+import os
 import time
-from typing import List, Optional, Dict, Any
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import islice
+from typing import List, Optional, Dict, Any, Union
 import pandas as pd
 import numpy as np
 import logging
+from pandas.io.parsers import TextParser
 
-from .base import BaseProcessor, ProcessingResult
+try:
+    import python_calamine  # noqa: F401 - Rust reader backing pandas' 'calamine' engine
+    CALAMINE_AVAILABLE = True
+except ImportError:  # python-calamine is optional; fall back to openpyxl
+    CALAMINE_AVAILABLE = False
+
+try:
+    import pyarrow as pa  # backs dtype_backend='pyarrow' and lazy=True
+    PYARROW_AVAILABLE = True
+except ImportError:  # pyarrow is optional; frames stay numpy-backed
+    pa = None
+    PYARROW_AVAILABLE = False
+
+from .base import BaseProcessor, ProcessingResult, run_in_pool
+from .xlsx_reader import read_xlsx_metadata
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Extensions calamine reads (replacing openpyxl when it is installed)
+CALAMINE_EXTENSIONS = ('xlsx', 'xlsm', 'xlsb')
+
+# pandas engine per extension when calamine is not available; unknown extensions use xlrd
+_ENGINE_FOR_EXT = {
+    'xlsx': 'openpyxl',
+    'xlsm': 'openpyxl',
+    'xltx': 'openpyxl',
+    'xltm': 'openpyxl',
+    'xlsb': 'pyxlsb',
+    'xls': 'xlrd',
+}
+
+def _extension(file_path: str) -> str:
+    """Lower-cased extension without the dot"""
+    return os.path.splitext(file_path)[1][1:].lower()
+
+
+def _engine_for(extension: str) -> str:
+    """Pick the pandas Excel engine for a file extension"""
+    if CALAMINE_AVAILABLE and extension in CALAMINE_EXTENSIONS:
+        return 'calamine'
+    return _ENGINE_FOR_EXT.get(extension, 'xlrd')
+
+
+def _calamine_cell(value: Any) -> Any:
+    """Convert a calamine cell value the way pandas' calamine reader does"""
+    if isinstance(value, float):
+        as_int = int(value)
+        return as_int if as_int == value else value
+    if isinstance(value, date):
+        return pd.Timestamp(value)
+    if isinstance(value, timedelta):
+        return pd.Timedelta(value)
+    return value
+
+
+def _sheet_rows(df: pd.DataFrame) -> List[list]:
+    """
+    Cell values of a header-less sheet as row lists, as pandas' readers hand them over
+    
+    A header=None read stores an int column as float64 once any cell in it
+    (such as a blank header cell) is empty; whole floats go back to ints and
+    gaps to '' here, as the engines' cell conversion does, so TextParser
+    infers the same names and dtypes.
+    """
+    columns = []
+    for _, values in df.items():
+        cells = values.to_numpy(dtype=object)
+        if values.dtype.kind == 'f':
+            numbers = values.to_numpy()
+            whole = np.flatnonzero(np.isfinite(numbers) & (numbers == np.floor(numbers)))
+            for i in whole:
+                cells[i] = int(numbers[i])
+        elif values.dtype == object:
+            for i, value in enumerate(cells):
+                if isinstance(value, float) and value.is_integer():
+                    cells[i] = int(value)
+        # Empty cells reach TextParser as '' from the engines
+        cells[values.isna().to_numpy()] = ''
+        columns.append(cells)
+    if not columns:
+        return []
+    return np.column_stack(columns).tolist()
+
+
+@lru_cache(maxsize=8)
+def _calamine_excel_file(file_path: str, mtime_ns: int, size: int) -> pd.ExcelFile:
+    """Open a workbook with calamine once per (path, mtime, size) and share it"""
+    return pd.ExcelFile(file_path, engine='calamine')
+
+
+@lru_cache(maxsize=128)
+def _sheet_names_cached(file_path: str, mtime_ns: int, size: int, engine: str) -> tuple:
+    """Sheet names of a workbook, once per (path, mtime, size)"""
+    if engine == 'calamine':
+        return tuple(_calamine_excel_file(file_path, mtime_ns, size).sheet_names)
+    with pd.ExcelFile(file_path, engine=engine) as excel_file:
+        return tuple(excel_file.sheet_names)
+
 
 class ExcelProcessor(BaseProcessor):
     """Process Excel files and extract data from all sheets"""
     
     def __init__(self):
         super().__init__()
+        self.chunk_rows = settings.EXCEL_CHUNK_ROWS
+        # Workbooks opened during one process() call, keyed by (engine, path, mtime, size)
+        self._wb_cache: Dict[tuple, pd.ExcelFile] = {}
+        # List-form usecols of the current process() call, as a set for O(1) lookups
+        self._usecols_set: Optional[frozenset] = None
     
     def process(self, file_path: str, **kwargs) -> ProcessingResult:
         """
@@ -34,11 +138,14 @@ class ExcelProcessor(BaseProcessor):
                 - header: int or None (default: 0)
                 - skiprows: int (default: 0)
                 - usecols: str or list (columns to use)
+                - dtype_backend: 'pyarrow' or 'numpy_nullable' (default: None = numpy dtypes)
+                - lazy: bool (default: False) - return sheets as pyarrow.Table
         
         Returns:
             ProcessingResult with extracted data
         """
         start_time = time.time()
+        self._wb_cache = {}
         
         try:
             # Validate file
@@ -52,69 +159,113 @@ class ExcelProcessor(BaseProcessor):
             header = kwargs.get('header', 0)
             skiprows = kwargs.get('skiprows', 0)
             usecols = kwargs.get('usecols')
+            dtype_backend = kwargs.get('dtype_backend')
+            lazy = bool(kwargs.get('lazy', False))
+            
+            # List usecols are matched locally against a frozenset, so each column check
+            # is O(1) (the same fix as pandas' c_parser_wrapper). Positions are applied to
+            # the raw sheet, names once the header row is known; other forms ("A:C",
+            # callables) still go to pandas.
+            usecols_set = frozenset(usecols) if isinstance(usecols, (list, tuple)) else None
+            self._usecols_set = usecols_set
+            read_usecols = usecols if usecols_set is None else None
             
             # Determine Excel engine based on file extension
-            extension = file_path.lower().split('.')[-1]
-            engine = 'openpyxl' if extension in ['xlsx', 'xlsm', 'xltx', 'xltm'] else 'xlrd'
+            extension = _extension(file_path)
+            engine = _engine_for(extension)
             
             # Auto-detect header if default (0) and not explicitly provided in kwargs
-            if 'header' not in kwargs:
-                # Detect header for each sheet if sheet_name is None (all sheets)
-                # or for the specific sheet
-                try:
-                    detected_header = self._detect_header_row(file_path, sheet_name, engine=engine)
-                    if detected_header is not None:
-                        header = detected_header
-                        self.logger.info(f"Auto-detected header at row {header} for {file_path}")
-                except Exception as he:
-                    self.logger.warning(f"Header detection failed: {str(he)}")
+            auto_header = 'header' not in kwargs
 
             # Read Excel file
             dataframes = []
             sheet_names = []
             warnings = []
             
-            if engine == 'xlrd' and not file_path.endswith('.xls'):
+            if engine == 'xlrd' and extension != 'xls':
                 warnings.append(f"Using xlrd engine for unknown extension. This may fail on modern Excel files.")
             
+            if dtype_backend == 'pyarrow' and not PYARROW_AVAILABLE:
+                warnings.append("pyarrow is not installed; returning numpy-backed columns.")
+                dtype_backend = None
+            metadata['dtype_backend'] = dtype_backend or 'numpy'
+            
+            if lazy and not PYARROW_AVAILABLE:
+                warnings.append("pyarrow is not installed; returning pandas DataFrames.")
+                lazy = False
+            metadata['frame_type'] = 'pyarrow.Table' if lazy else 'pandas.DataFrame'
+            
             try:
-                # Read all sheets or specific sheet
-                excel_data = pd.read_excel(
-                    file_path,
-                    sheet_name=sheet_name,
-                    header=header,
-                    skiprows=skiprows,
-                    usecols=usecols,
-                    engine=engine
-                )
+                raw_data = None
+                
+                # With calamine, convert sheet rows in bounded batches
+                if (engine == 'calamine' and read_usecols is None
+                        and not isinstance(sheet_name, list) and isinstance(skiprows, int)):
+                    try:
+                        raw_data = self._read_calamine(file_path, sheet_name, skiprows)
+                    except Exception as ce:
+                        self.logger.debug("Chunked calamine read failed, using pd.read_excel: %s", ce)
+                        raw_data = None
+                    except BaseException as ce:
+                        # A Rust panic surfaces as pyo3's PanicException, which derives
+                        # from BaseException and is not importable; anything else propagates
+                        if type(ce).__name__ != 'PanicException':
+                            raise
+                        self.logger.warning("Calamine panicked reading %s, using pd.read_excel: %s", file_path, ce)
+                        raw_data = None
+                
+                if raw_data is None:
+                    # Read all sheets or specific sheet once, without a header;
+                    # header detection and application both work on this parse
+                    raw_data = pd.read_excel(
+                        self._excel_source(file_path, engine),
+                        sheet_name=sheet_name,
+                        header=None,
+                        skiprows=skiprows,
+                        usecols=read_usecols,
+                        engine=engine
+                    )
+                
+                if isinstance(raw_data, dict):
+                    excel_data = {
+                        sheet: self._frame_with_header(raw_df, header, auto_header, file_path)
+                        for sheet, raw_df in raw_data.items()
+                    }
+                else:
+                    excel_data = self._frame_with_header(raw_data, header, auto_header, file_path)
                 
                 # Handle single sheet vs multiple sheets
                 if isinstance(excel_data, dict):
-                    # Multiple sheets
-                    for sheet, df in excel_data.items():
-                        if not df.empty:
-                            cleaned_df = self.clean_dataframe(df)
-                            dataframes.append(cleaned_df)
-                            sheet_names.append(str(sheet))
+                    # Multiple sheets: clean them concurrently on the shared pool
+                    # (pandas/numpy kernels release the GIL), keeping workbook order
+                    non_empty = [(sheet, df) for sheet, df in excel_data.items() if not df.empty]
+                    cleaned = run_in_pool(
+                        lambda df: self._clean_sheet(df, dtype_backend, lazy),
+                        [df for _, df in non_empty]
+                    )
+                    for (sheet, _), cleaned_df in zip(non_empty, cleaned):
+                        dataframes.append(cleaned_df)
+                        sheet_names.append(str(sheet))
                 else:
                     # Single sheet
                     if not excel_data.empty:
-                        cleaned_df = self.clean_dataframe(excel_data)
+                        cleaned_df = self._clean_sheet(excel_data, dtype_backend, lazy)
                         dataframes.append(cleaned_df)
                         sheet_names.append(
                             str(sheet_name) if sheet_name else "Sheet1"
                         )
                 
-                # Get additional metadata using openpyxl
-                if file_path.endswith('.xlsx'):
-                    excel_metadata = self._extract_excel_metadata(file_path)
+                # Get additional metadata, reusing the openpyxl workbook if the read opened one
+                if _ENGINE_FOR_EXT.get(extension) == 'openpyxl':
+                    opened = self._wb_cache.get(self._workbook_key('openpyxl', file_path))
+                    excel_metadata = self._extract_excel_metadata(
+                        file_path, wb=opened.book if opened is not None else None
+                    )
                     metadata.update(excel_metadata)
             
             except Exception as e:
-                import traceback
-                error_detail = traceback.format_exc().splitlines()[-1]
-                self.logger.error(f"Error reading Excel file: {str(e)}")
-                warnings.append(f"Error reading sheets: {error_detail}")
+                self.logger.exception("Error reading Excel file: %s", e)
+                warnings.append(f"Error reading sheets: {type(e).__name__}: {e}")
                 
                 if engine == 'xlrd' and "Excel 2007" in str(e):
                     warnings.append("Note: xlrd only supports old .xls files. For .xlsx, openpyxl is required.")
@@ -146,13 +297,325 @@ class ExcelProcessor(BaseProcessor):
                 error_message=str(e),
                 processing_time=time.time() - start_time
             )
+        
+        finally:
+            self._close_workbooks()
     
-    def _extract_excel_metadata(self, file_path: str) -> Dict[str, Any]:
+    def _read_calamine(
+        self,
+        file_path: str,
+        sheet_name: Union[str, int, None],
+        skiprows: int = 0
+    ) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
         """
-        Extract metadata from Excel file using openpyxl
+        Read sheets with calamine, header-less, converting rows in chunks
+        
+        pd.read_excel builds the Python list of every cell in a sheet before
+        making a DataFrame. Here rows are pulled from the calamine sheet
+        chunk_rows at a time and each batch goes through the same cell
+        conversion and TextParser as pandas, so at most one batch of Python
+        objects exists at a time.
         
         Args:
             file_path: Path to Excel file
+            sheet_name: Sheet name or index, or None for all sheets
+            skiprows: Leading rows to skip
+        
+        Returns:
+            DataFrame (header=None layout) for one sheet, or dict of them for all sheets
+        """
+        excel_file = self._get_calamine_wb(file_path)
+        names = excel_file.sheet_names
+        
+        if sheet_name is None:
+            selected = names
+        elif isinstance(sheet_name, int):
+            selected = [names[sheet_name]]
+        else:
+            if sheet_name not in names:
+                raise ValueError(f"Worksheet named '{sheet_name}' not found")
+            selected = [sheet_name]
+        
+        frames = {}
+        for name in selected:
+            sheet = excel_file.book.get_sheet_by_name(name)
+            
+            if sheet.start is None or sheet.total_height == 0:
+                # Blank worksheet: iter_rows would panic on its missing range
+                frames[name] = pd.DataFrame()
+                continue
+            
+            # iter_rows pads leading empty rows but not leading empty columns
+            pad = [''] * sheet.start[1] if sheet.start else []
+            rows = islice(sheet.iter_rows(), skiprows, None)
+            
+            chunks = []
+            while True:
+                batch = [
+                    pad + [_calamine_cell(cell) for cell in row]
+                    for row in islice(rows, self.chunk_rows)
+                ]
+                if not batch:
+                    break
+                chunks.append(TextParser(batch, header=None).read())
+            
+            if not chunks:
+                frames[name] = pd.DataFrame()
+            elif len(chunks) == 1:
+                frames[name] = chunks[0]
+            else:
+                self.logger.info("Read sheet %s in %d chunks of %d rows", name, len(chunks), self.chunk_rows)
+                frames[name] = pd.concat(chunks, ignore_index=True, copy=False)
+        
+        if sheet_name is None:
+            return frames
+        return frames[selected[0]]
+    
+    def _clean_sheet(
+        self,
+        df: pd.DataFrame,
+        dtype_backend: Optional[str] = None,
+        lazy: bool = False
+    ) -> Union[pd.DataFrame, 'pa.Table']:
+        """
+        Clean a sheet and optionally move it onto nullable/Arrow dtypes
+        
+        Type inference runs on the numpy frame first, so the conversion only
+        changes storage (Arrow strings, nullable ints with pd.NA), not values.
+        
+        Args:
+            df: Sheet DataFrame with header applied
+            dtype_backend: 'pyarrow', 'numpy_nullable' or None to keep numpy dtypes
+            lazy: Hand the sheet back as a pyarrow.Table instead of a DataFrame
+        
+        Returns:
+            Cleaned DataFrame, or pyarrow.Table when lazy
+        """
+        if self._needs_cleaning(df):
+            df = self.clean_dataframe(df)
+        if dtype_backend:
+            df = df.convert_dtypes(dtype_backend=dtype_backend)
+        if lazy:
+            return self._to_arrow(df)
+        return df
+    
+    def _needs_cleaning(self, df: pd.DataFrame) -> bool:
+        """
+        Check whether clean_dataframe would change a sheet
+        
+        A sheet of typed (non-object) columns with clean, unique string names,
+        a default index and no all-empty rows or columns comes out of
+        clean_dataframe unchanged, so the copy and passes can be skipped.
+        
+        Args:
+            df: Sheet DataFrame with header applied
+        
+        Returns:
+            True if the sheet should go through clean_dataframe
+        """
+        if (df.dtypes == object).any():
+            return True
+        
+        index = df.index
+        if not (isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1):
+            return True
+        
+        columns = df.columns
+        if not columns.is_unique or not all(
+            isinstance(col, str) and col and col == col.strip()
+            and "Unnamed:" not in col and col.lower() != "nan"
+            for col in columns
+        ):
+            return True
+        
+        missing = df.isna().to_numpy()
+        return bool(missing.all(axis=0).any() or missing.all(axis=1).any())
+    
+    def _to_arrow(self, df: pd.DataFrame) -> 'pa.Table':
+        """
+        Convert a cleaned sheet to a pyarrow.Table
+        
+        Object columns mixing types (numbers and labels in one column) have
+        no Arrow type; those are stored as text, nulls kept.
+        
+        Args:
+            df: Cleaned sheet DataFrame
+        
+        Returns:
+            pyarrow.Table with the sheet's columns
+        """
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            df = df.copy()
+            for col in df.columns[df.dtypes == object]:
+                values = df[col]
+                df[col] = values.where(values.isna(), values.astype(str))
+            return pa.Table.from_pandas(df, preserve_index=False)
+    
+    def _frame_with_header(
+        self,
+        raw_df: pd.DataFrame,
+        header: Optional[int],
+        auto_header: bool,
+        file_path: str
+    ) -> pd.DataFrame:
+        """
+        Apply the requested or auto-detected header row to a header-less sheet
+        
+        Args:
+            raw_df: Sheet read with header=None (skipped rows already removed)
+            header: Requested header row
+            auto_header: Whether to detect the header from the sheet's first rows
+            file_path: Path to Excel file (for logging)
+        
+        Returns:
+            DataFrame with header row applied
+        """
+        usecols_set = self._usecols_set
+        by_name = usecols_set is not None and any(isinstance(col, str) for col in usecols_set)
+        
+        if auto_header:
+            try:
+                detected_header = self._pick_header(raw_df.head(20).infer_objects())
+                if detected_header is not None:
+                    header = detected_header
+                    self.logger.info(f"Auto-detected header at row {header} for {file_path}")
+            except Exception as he:
+                self.logger.warning(f"Header detection failed: {str(he)}")
+        
+        if usecols_set is not None and not by_name:
+            raw_df = self._select_columns(raw_df, usecols_set)
+        
+        df = self._apply_header(raw_df, header)
+        
+        if by_name:
+            df = self._select_columns(df, usecols_set)
+        
+        return df
+    
+    def _select_columns(self, df: pd.DataFrame, usecols_set: frozenset) -> pd.DataFrame:
+        """
+        Keep the columns named in usecols, in sheet order, as pd.read_excel does
+        
+        Args:
+            df: Sheet DataFrame
+            usecols_set: Column labels (or positions on a header-less sheet) to keep
+        
+        Returns:
+            DataFrame with only the requested columns
+        """
+        missing = usecols_set.difference(df.columns)
+        if missing:
+            raise ValueError(
+                f"Usecols do not match columns, columns expected but not found: {sorted(missing, key=str)}"
+            )
+        
+        return df.loc[:, [col in usecols_set for col in df.columns]]
+    
+    def _apply_header(
+        self,
+        raw_df: pd.DataFrame,
+        header: Optional[int]
+    ) -> pd.DataFrame:
+        """
+        Turn a header-less sheet into the frame pd.read_excel would return
+        
+        Args:
+            raw_df: Sheet read with header=None
+            header: Header row index (None for no header)
+        
+        Returns:
+            DataFrame with header row applied
+        """
+        if header is None:
+            return raw_df.reset_index(drop=True)
+        
+        if header >= len(raw_df):
+            return pd.DataFrame()
+        
+        # Re-parse from the header row with the TextParser pd.read_excel uses, so
+        # names ("Unnamed: i", ".1" suffixes) and dtypes come out the same
+        return TextParser(_sheet_rows(raw_df.iloc[header:]), header=0).read()
+    
+    def _excel_source(self, file_path: str, engine: str) -> Union[str, pd.ExcelFile]:
+        """
+        Get what to hand pd.read_excel for a file
+        
+        Args:
+            file_path: Path to Excel file
+            engine: Excel engine in use
+        
+        Returns:
+            Workbook already opened for this process() call, or the path itself
+        """
+        if engine == 'calamine':
+            return self._get_calamine_wb(file_path)
+        if engine == 'openpyxl':
+            return self._get_openpyxl_wb(file_path)
+        return file_path
+    
+    def _workbook_key(self, engine: str, file_path: str) -> tuple:
+        """Cache key for a workbook: engine plus the file's identity on disk"""
+        stat = os.stat(file_path)
+        return (engine, file_path, stat.st_mtime_ns, stat.st_size)
+    
+    def _get_openpyxl_wb(self, file_path: str) -> pd.ExcelFile:
+        """
+        Open a workbook with openpyxl (read-only, values) once per process() call
+        
+        The returned ExcelFile serves pd.read_excel, and its .book is the
+        openpyxl Workbook used for metadata and data range detection.
+        
+        Args:
+            file_path: Path to Excel file
+        
+        Returns:
+            ExcelFile backed by openpyxl
+        """
+        key = self._workbook_key('openpyxl', file_path)
+        excel_file = self._wb_cache.get(key)
+        if excel_file is None:
+            excel_file = pd.ExcelFile(file_path, engine='openpyxl')
+            self._wb_cache[key] = excel_file
+        return excel_file
+    
+    def _get_calamine_wb(self, file_path: str) -> pd.ExcelFile:
+        """
+        Get the calamine workbook for a file, shared across process() calls
+        
+        Args:
+            file_path: Path to Excel file
+        
+        Returns:
+            ExcelFile backed by calamine
+        """
+        key = self._workbook_key('calamine', file_path)
+        excel_file = self._wb_cache.get(key)
+        if excel_file is None:
+            excel_file = _calamine_excel_file(*key[1:])
+            self._wb_cache[key] = excel_file
+        return excel_file
+    
+    def _close_workbooks(self):
+        """Close workbooks opened during process(); calamine handles stay in the shared cache"""
+        for (engine, *_), excel_file in self._wb_cache.items():
+            if engine == 'calamine':
+                continue
+            try:
+                excel_file.close()
+            except Exception as e:
+                self.logger.debug("Could not close workbook: %s", e)
+        self._wb_cache = {}
+    
+    def _extract_excel_metadata(self, file_path: str, wb: Any = None) -> Dict[str, Any]:
+        """
+        Extract metadata from an Excel file's package parts
+        
+        Args:
+            file_path: Path to Excel file
+            wb: Already opened openpyxl Workbook (optional, left open); its
+                parsed properties are used instead of re-reading the archive
         
         Returns:
             Dictionary with metadata
@@ -160,10 +623,9 @@ class ExcelProcessor(BaseProcessor):
         metadata = {}
         
         try:
-            from openpyxl import load_workbook
-            
-            # Load workbook (read-only for performance)
-            wb = load_workbook(file_path, read_only=True, data_only=True)
+            if wb is None:
+                # workbook.xml and core.xml only; no worksheet is parsed
+                return read_xlsx_metadata(file_path)
             
             # Get sheet information
             metadata['sheet_count'] = len(wb.sheetnames)
@@ -178,8 +640,6 @@ class ExcelProcessor(BaseProcessor):
                 metadata['last_modified_by'] = props.lastModifiedBy
                 metadata['title'] = props.title
                 metadata['subject'] = props.subject
-            
-            wb.close()
         
         except Exception as e:
             self.logger.warning(f"Could not extract Excel metadata: {str(e)}")
@@ -197,9 +657,10 @@ class ExcelProcessor(BaseProcessor):
             List of sheet names
         """
         try:
-            engine = 'openpyxl' if file_path.endswith('.xlsx') else 'xlrd'
-            excel_file = pd.ExcelFile(file_path, engine=engine)
-            return excel_file.sheet_names
+            stat = os.stat(file_path)
+            return list(_sheet_names_cached(
+                file_path, stat.st_mtime_ns, stat.st_size, _engine_for(_extension(file_path))
+            ))
         except Exception as e:
             self.logger.error(f"Error getting sheet names: {str(e)}")
             return []
@@ -234,31 +695,34 @@ class ExcelProcessor(BaseProcessor):
         try:
             from openpyxl import load_workbook
             
-            wb = load_workbook(file_path, data_only=False)
+            # Read-only mode streams rows instead of building every Cell up front
+            wb = load_workbook(file_path, data_only=False, read_only=True, keep_links=False)
             
             sheets_data = {}
             
             for sheet_name in wb.sheetnames:
                 ws = wb[sheet_name]
                 
+                try:
+                    dimensions = ws.calculate_dimension()
+                except ValueError:
+                    # Sheet XML carries no <dimension>; size it by scanning
+                    dimensions = ws.calculate_dimension(force=True)
+                
                 sheet_info = {
                     'data': [],
                     'formulas': {},
-                    'dimensions': ws.dimensions
+                    'dimensions': dimensions
                 }
                 
-                # Extract data and formulas
-                for row_idx, row in enumerate(ws.iter_rows(values_only=False), 1):
-                    row_data = []
-                    for col_idx, cell in enumerate(row, 1):
-                        row_data.append(cell.value)
-                        
-                        # Check if cell has a formula
+                # One streamed pass for values and formulas; cell.coordinate is
+                # correct past column Z (AA, AB, ...)
+                formulas = sheet_info['formulas']
+                for row in ws.iter_rows(values_only=False):
+                    sheet_info['data'].append([cell.value for cell in row])
+                    for cell in row:
                         if cell.data_type == 'f':
-                            cell_coord = f"{chr(64 + col_idx)}{row_idx}"
-                            sheet_info['formulas'][cell_coord] = cell.value
-                    
-                    sheet_info['data'].append(row_data)
+                            formulas[cell.coordinate] = cell.value
                 
                 sheets_data[sheet_name] = sheet_info
             
@@ -269,21 +733,24 @@ class ExcelProcessor(BaseProcessor):
             self.logger.error(f"Error extracting formulas: {str(e)}")
             return {}
     
-    def detect_data_range(self, file_path: str, sheet_name: str = None) -> Dict[str, Any]:
+    def detect_data_range(self, file_path: str, sheet_name: str = None, wb: Any = None) -> Dict[str, Any]:
         """
         Detect the actual data range in Excel sheet (skip empty rows/cols)
         
         Args:
             file_path: Path to Excel file
             sheet_name: Specific sheet name (optional)
+            wb: Already opened openpyxl Workbook (optional, left open)
         
         Returns:
             Dictionary with data range information
         """
         try:
-            from openpyxl import load_workbook
-            
-            wb = load_workbook(file_path, read_only=True)
+            owns_wb = wb is None
+            if owns_wb:
+                from openpyxl import load_workbook
+                
+                wb = load_workbook(file_path, read_only=True)
             sheet = wb[sheet_name] if sheet_name else wb.active
             
             # Get dimensions
@@ -292,25 +759,31 @@ class ExcelProcessor(BaseProcessor):
             min_col = sheet.min_column
             max_col = sheet.max_column
             
-            # Find actual data range (skip empty leading rows/cols)
-            actual_min_row = min_row
-            actual_min_col = min_col
+            # Find actual data range (skip empty leading rows/cols) in one streamed pass
+            actual_min_row = None
+            col_has_data = np.zeros(max_col - min_col + 1, dtype=bool)
             
-            # Find actual min row
-            for row_idx in range(min_row, max_row + 1):
-                row_cells = [sheet.cell(row=row_idx, column=c).value for c in range(min_col, max_col + 1)]
-                if any(v is not None for v in row_cells):
+            rows = sheet.iter_rows(
+                min_row=min_row, max_row=max_row,
+                min_col=min_col, max_col=max_col,
+                values_only=True
+            )
+            for row_idx, row in enumerate(rows, start=min_row):
+                present = np.fromiter((v is not None for v in row), dtype=bool, count=len(row))
+                if actual_min_row is None and present.any():
                     actual_min_row = row_idx
+                col_has_data[:len(present)] |= present
+                
+                # Nothing left to learn once the first row and first column both have data
+                if actual_min_row is not None and col_has_data[0]:
                     break
             
-            # Find actual min column
-            for col_idx in range(min_col, max_col + 1):
-                col_cells = [sheet.cell(row=r, column=col_idx).value for r in range(min_row, max_row + 1)]
-                if any(v is not None for v in col_cells):
-                    actual_min_col = col_idx
-                    break
+            if actual_min_row is None:
+                actual_min_row = min_row
+            actual_min_col = min_col + int(col_has_data.argmax()) if col_has_data.any() else min_col
             
-            wb.close()
+            if owns_wb:
+                wb.close()
             
             return {
                 'min_row': actual_min_row,
@@ -325,57 +798,83 @@ class ExcelProcessor(BaseProcessor):
             self.logger.error(f"Error detecting data range: {str(e)}")
             return {}
 
-    def _detect_header_row(self, file_path: str, sheet_name: Any = None, engine: str = 'openpyxl') -> Optional[int]:
+    def _pick_header(self, preview_df: pd.DataFrame) -> Optional[int]:
         """
-        Heuristic to detect the most likely header row in an Excel sheet.
+        Pick the most likely header row from the first rows of a header-less sheet
+        
+        Args:
+            preview_df: Up to 20 leading rows read with header=None
+        
+        Returns:
+            Row index of the header, or None if no row looks like one
         """
         try:
-            # Read first 20 rows without header to analyze
-            preview_df = pd.read_excel(
-                file_path,
-                sheet_name=sheet_name if sheet_name is not None else 0,
-                header=None,
-                nrows=20,
-                engine=engine
-            )
-            
             if preview_df.empty:
                 return None
             
-            scores = []
-            for idx, row in preview_df.iterrows():
-                non_null_row = row.dropna()
-                # Also treat empty strings as null for heuristic purposes
-                non_empty_row = non_null_row[non_null_row.astype(str).str.strip() != ""]
-                
-                if non_empty_row.empty:
-                    scores.append(-1.0)
-                    continue
-                
-                # Factors for a good header:
-                # 1. Breadth: Headers usually span multiple columns
-                width_ratio = non_empty_row.count() / len(row)
-                
-                # 2. Type: Most values are strings (headers are labels)
-                string_ratio = non_empty_row.apply(lambda x: isinstance(x, str)).mean()
-                
-                # 3. Quality: Values are unique
-                unique_ratio = non_empty_row.nunique() / non_empty_row.count() if non_empty_row.count() > 0 else 0
-                
-                # 4. Length: Values aren't too long
-                avg_len = non_empty_row.apply(lambda x: len(str(x))).mean()
-                len_score = 1.0 if avg_len < 30 else (0.5 if avg_len < 60 else 0.1)
-                
-                # 5. Penalize numeric-heavy rows
-                numeric_count = pd.to_numeric(non_empty_row, errors='coerce').notna().sum()
-                numeric_ratio = numeric_count / non_empty_row.count()
-                
-                # Calculate weighted score (Heuristic)
-                # Stronger weights on width and strings
-                score = (width_ratio * 0.4) + (string_ratio * 0.3) + (unique_ratio * 0.2) + (len_score * 0.1) - (numeric_ratio * 0.6)
-                scores.append(score)
+            # A lone row can only be the header
+            if len(preview_df) == 1:
+                return 0
+            
+            # Obvious header: a full row of distinct, short, non-numeric labels over numeric data.
+            # Such a row already gets the top score, so skip the scoring below
+            first = preview_df.iloc[0].tolist()
+            if (all(isinstance(v, str) and v.strip() for v in first)
+                    and len(set(first)) == len(first)
+                    and sum(map(len, first)) < 30 * len(first)
+                    and pd.to_numeric(pd.Series(first), errors='coerce').isna().all()
+                    and pd.to_numeric(preview_df.iloc[1], errors='coerce').notna().mean() > 0.8):
+                return 0
+            
+            # Score all preview rows at once on the 2-D object array
+            values = preview_df.to_numpy(dtype=object)
+            as_text = np.frompyfunc(str, 1, 1)(values)
+            
+            # Also treat blank strings as null for heuristic purposes
+            non_empty = ~pd.isna(values) & np.frompyfunc(
+                lambda t: bool(t.strip()), 1, 1
+            )(as_text).astype(bool)
+            counts = non_empty.sum(axis=1)
+            has_values = counts > 0
+            safe_counts = np.where(has_values, counts, 1)
+            
+            # Factors for a good header:
+            # 1. Breadth: Headers usually span multiple columns
+            width_ratio = counts / values.shape[1]
+            
+            # 2. Type: Most values are strings (headers are labels)
+            is_str = np.frompyfunc(lambda v: isinstance(v, str), 1, 1)(values).astype(bool)
+            string_ratio = (is_str & non_empty).sum(axis=1) / safe_counts
+            
+            # 3. Quality: Values are unique
+            unique_ratio = np.array([
+                len(set(row[mask])) for row, mask in zip(values, non_empty)
+            ]) / safe_counts
+            
+            # 4. Length: Values aren't too long
+            lengths = np.frompyfunc(len, 1, 1)(as_text).astype(np.int64)
+            avg_len = np.where(non_empty, lengths, 0).sum(axis=1) / safe_counts
+            len_score = np.select([avg_len < 30, avg_len < 60], [1.0, 0.5], 0.1)
+            
+            # 5. Penalize numeric-heavy rows: one to_numeric over the flattened block.
+            # A row holding only dates/durations (and nulls) is a datetime row to pandas,
+            # so those values count as numeric there, as a per-row to_numeric would have it
+            is_numeric = pd.to_numeric(
+                pd.Series(values.ravel()), errors='coerce'
+            ).notna().to_numpy().reshape(values.shape)
+            is_temporal = np.frompyfunc(
+                lambda v: isinstance(v, (datetime, timedelta, np.datetime64, np.timedelta64)), 1, 1
+            )(values).astype(bool)
+            temporal_rows = (is_temporal | pd.isna(values)).all(axis=1, keepdims=True)
+            is_numeric = (is_numeric | (is_temporal & temporal_rows)) & non_empty
+            numeric_ratio = is_numeric.sum(axis=1) / safe_counts
+            
+            # Calculate weighted score (Heuristic)
+            # Stronger weights on width and strings
+            scores = (width_ratio * 0.4) + (string_ratio * 0.3) + (unique_ratio * 0.2) + (len_score * 0.1) - (numeric_ratio * 0.6)
+            scores = np.where(has_values, scores, -1.0)
             
-            if not scores:
+            if not len(scores):
                 return None
                 
             # Pick the best overall row
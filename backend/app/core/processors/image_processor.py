@@ -4,43 +4,147 @@ Supports PNG, JPG, JPEG formats
 """
 #backend/app/core/processors/image_processor.py
 
+import os
+import queue
+from collections import OrderedDict
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+import threading
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 from PIL import Image
 import logging
 
-from .base import BaseProcessor, ProcessingResult
+try:
+    import cv2  # SIMD grayscale/contrast on the raw pixel buffer
+    CV2_AVAILABLE = True
+except ImportError:  # opencv is optional; PIL does the preprocessing
+    CV2_AVAILABLE = False
+
+try:
+    import tesserocr  # in-process Tesseract API; no subprocess or temp file per call
+    TESSEROCR_AVAILABLE = True
+except ImportError:  # tesserocr is optional; fall back to the pytesseract CLI wrapper
+    TESSEROCR_AVAILABLE = False
+
+from .base import BaseProcessor, ProcessingResult, run_in_pool
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# PIL transposes (counter-clockwise) for the clockwise angles Tesseract OSD reports
+_CLOCKWISE_TRANSPOSE = {
+    90.0: Image.Transpose.ROTATE_270,
+    180.0: Image.Transpose.ROTATE_180,
+    270.0: Image.Transpose.ROTATE_90,
+}
+
+# Idle tesserocr APIs per language, created on demand up to TESS_API_POOL_SIZE
+# each. Tesseract itself runs about four OpenMP threads per recognition, so
+# one engine per four cores keeps the CPUs busy without oversubscribing them.
+TESS_API_POOL_SIZE = max(1, (os.cpu_count() or 1) // 4)
+_tess_pools: Dict[str, queue.Queue] = {}
+_tess_pool_sizes: Dict[str, int] = {}
+_tess_pools_lock = threading.Lock()
+
+
+# Decoded images kept for the open -> detect_orientation -> auto_rotate ->
+# extract_with_layout flow, which would otherwise decode the same file each step.
+# Bounded by decoded pixel bytes; an image larger than the budget is never cached.
+DECODED_IMAGE_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def _decoded_size(image: Image.Image) -> int:
+    """Approximate bytes held by a decoded image's pixel buffer"""
+    return image.width * image.height * len(image.getbands())
+
+
+@contextmanager
+def _tess_api(language: str) -> Iterator[Any]:
+    """Borrow a tesserocr API for a language, waiting if all are in use"""
+    with _tess_pools_lock:
+        pool = _tess_pools.setdefault(language, queue.Queue())
+        create = pool.empty() and _tess_pool_sizes.get(language, 0) < TESS_API_POOL_SIZE
+        if create:
+            _tess_pool_sizes[language] = _tess_pool_sizes.get(language, 0) + 1
+    
+    if create:
+        try:
+            api = tesserocr.PyTessBaseAPI(lang=language)
+        except Exception:
+            with _tess_pools_lock:
+                _tess_pool_sizes[language] -= 1
+            raise
+    else:
+        api = pool.get()
+    
+    try:
+        yield api
+    finally:
+        api.Clear()
+        pool.put(api)
+
+
+@lru_cache(maxsize=None)
+def _probe_tesseract(tesseract_path: Optional[str]) -> Tuple[bool, Optional[str], Optional[str]]:
+    """
+    Check the Tesseract binary once per process and path
+    
+    Args:
+        tesseract_path: Configured tesseract executable (None = look in PATH)
+    
+    Returns:
+        Tuple of (available, version, error message)
+    """
+    try:
+        import pytesseract
+        if tesseract_path:
+            pytesseract.pytesseract.tesseract_cmd = tesseract_path
+        # Quick check if tesseract is actually responsive
+        return True, str(pytesseract.get_tesseract_version()), None
+    except Exception as e:
+        return False, None, str(e)
+
 
 class ImageProcessor(BaseProcessor):
     """Process images and extract text using OCR"""
     
+    # Shared across instances: get_processor() builds a new processor per call
+    _image_cache: "OrderedDict[Tuple[str, int, int], Image.Image]" = OrderedDict()
+    _image_cache_bytes = 0
+    _image_cache_lock = threading.Lock()
+    
     def __init__(self):
         super().__init__()
         self.max_size = settings.IMAGE_MAX_SIZE
         
-        # Set tesseract path if configured
+        # Set tesseract path if configured; the version probe spawns a
+        # subprocess, so it runs once per process rather than per instance
         self.tesseract_available = False
-        if settings.TESSERACT_PATH:
-            try:
-                import pytesseract
-                pytesseract.pytesseract.tesseract_cmd = settings.TESSERACT_PATH
-                # Quick check if tesseract is actually responsive
-                pytesseract.get_tesseract_version()
-                self.tesseract_available = True
-            except Exception as e:
-                self.logger.warning(f"Tesseract not found at {settings.TESSERACT_PATH}: {str(e)}")
+        if TESSEROCR_AVAILABLE:
+            self.tesseract_available = True
         else:
-            try:
-                import pytesseract
-                pytesseract.get_tesseract_version()
-                self.tesseract_available = True
-            except:
-                self.logger.warning("Tesseract not found in PATH. OCR will be disabled.")
+            available, _, error = _probe_tesseract(settings.TESSERACT_PATH)
+            self.tesseract_available = available
+            if not available:
+                if settings.TESSERACT_PATH:
+                    self.logger.warning(f"Tesseract not found at {settings.TESSERACT_PATH}: {error}")
+                else:
+                    self.logger.warning("Tesseract not found in PATH. OCR will be disabled.")
+    
+    @property
+    def pytesseract_available(self) -> bool:
+        """
+        Whether the tesseract CLI behind pytesseract responds
+        
+        tesserocr alone sets tesseract_available, but layout and orientation
+        still shell out through pytesseract, so they check the binary
+        separately (once per process and path).
+        """
+        return _probe_tesseract(settings.TESSERACT_PATH)[0]
     
     def process(self, file_path: str, **kwargs) -> ProcessingResult:
         """
@@ -79,49 +183,17 @@ class ImageProcessor(BaseProcessor):
             image_info = self._get_image_info(image)
             metadata.update(image_info)
             
-            # Resize if too large
+            # Resize if too large, then grayscale/contrast straight into an array
             if preprocess:
-                image = self._preprocess_image(image)
-            
-            # Extract text using OCR
-            text_content = self._extract_text_ocr(image, language, psm)
-            
-            warnings = []
-            dataframes = []
-            
-            # Try to extract tables if requested
-            if extract_tables and text_content:
-                tables = self._extract_tables_from_text(text_content)
-                if tables:
-                    dataframes.extend(tables)
-                else:
-                    warnings.append("No tables could be extracted from OCR text")
-            
-            # Check OCR confidence
-            confidence = self._get_ocr_confidence(image, language)
-            metadata['ocr_confidence'] = confidence
+                image = self._preprocess_pixels(image)
             
-            if confidence < 60:
-                warnings.append(
-                    f"Low OCR confidence ({confidence}%). "
-                    "Consider using a higher quality image."
-                )
+            # Extract text and confidence using OCR
+            text_content, confidence = self._run_ocr(image, language, psm)
             
-            # Create result
-            result = ProcessingResult(
-                success=True,
-                file_path=file_path,
-                file_type='image',
-                dataframes=dataframes,
-                text_content=text_content,
-                metadata=metadata,
-                processing_time=time.time() - start_time,
-                warnings=warnings,
-                sheet_names=[f"Table_{i+1}" for i in range(len(dataframes))]
+            return self._build_result(
+                file_path, metadata, text_content, confidence,
+                extract_tables, time.time() - start_time
             )
-            
-            self.log_processing_info(result)
-            return result
         
         except Exception as e:
             self.logger.error(f"Error processing image {file_path}: {str(e)}")
@@ -133,6 +205,226 @@ class ImageProcessor(BaseProcessor):
                 processing_time=time.time() - start_time
             )
     
+    def process_batch(self, file_paths: List[str], **kwargs) -> List[ProcessingResult]:
+        """
+        Process several images with one Tesseract run
+        
+        Tesseract reads a .txt file listing image paths as a multi-page input,
+        so the engine and language model load once for the whole batch
+        instead of once per image.
+        
+        Args:
+            file_paths: Paths to image files
+            **kwargs: Same options as process()
+        
+        Returns:
+            One ProcessingResult per input path, in order
+        """
+        if TESSEROCR_AVAILABLE:
+            # OCR already runs in-process without per-call startup; tesserocr
+            # releases the GIL while recognizing, so pooled APIs run in parallel
+            return run_in_pool(lambda file_path: self.process(file_path, **kwargs), file_paths)
+        
+        if len(file_paths) < 2:
+            return [self.process(file_path, **kwargs) for file_path in file_paths]
+        
+        start_time = time.time()
+        
+        language = kwargs.get('language', 'eng')
+        preprocess = kwargs.get('preprocess', True)
+        extract_tables = kwargs.get('extract_tables', True)
+        psm = kwargs.get('psm', 3)
+        
+        results: List[Optional[ProcessingResult]] = [None] * len(file_paths)
+        batch = []  # (index, metadata) of images that made it into the manifest
+        
+        try:
+            if not self.tesseract_available:
+                raise RuntimeError("Tesseract OCR is not installed or not in PATH.")
+            
+            import pytesseract
+            
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                image_paths = []
+                for index, file_path in enumerate(file_paths):
+                    try:
+                        self.validate_file(file_path)
+                        metadata = self.get_file_metadata(file_path)
+                        
+                        with Image.open(file_path) as image:
+                            metadata.update(self._get_image_info(image))
+                            if preprocess:
+                                image = self._preprocess_image(image)
+                            image_path = os.path.join(tmp_dir, f"{index}.png")
+                            image.save(image_path)
+                        
+                        image_paths.append(image_path)
+                        batch.append((index, metadata))
+                    except Exception as e:
+                        self.logger.error(f"Error processing image {file_path}: {str(e)}")
+                        results[index] = ProcessingResult(
+                            success=False,
+                            file_path=file_path,
+                            file_type='image',
+                            error_message=str(e)
+                        )
+                
+                if batch:
+                    manifest = os.path.join(tmp_dir, 'images.txt')
+                    with open(manifest, 'w', encoding='utf-8') as f:
+                        f.write('\n'.join(image_paths) + '\n')
+                    
+                    # One run over the list; page_num tells the images apart
+                    data = pytesseract.image_to_data(
+                        manifest,
+                        lang=language,
+                        config=f'--psm {psm}',
+                        output_type=pytesseract.Output.DICT
+                    )
+                    pages = self._split_ocr_pages(data)
+            
+            elapsed = (time.time() - start_time) / max(len(batch), 1)
+            for page, (index, metadata) in enumerate(batch, start=1):
+                page_data = pages.get(page, {'block_num': [], 'par_num': [], 'line_num': [], 'text': [], 'conf': []})
+                results[index] = self._build_result(
+                    file_paths[index], metadata,
+                    self._text_from_ocr_data(page_data),
+                    self._confidence_from_ocr_data(page_data),
+                    extract_tables, elapsed
+                )
+        
+        except Exception as e:
+            self.logger.error(f"Batch OCR failed: {str(e)}")
+            for index, file_path in enumerate(file_paths):
+                if results[index] is None:
+                    results[index] = ProcessingResult(
+                        success=False,
+                        file_path=file_path,
+                        file_type='image',
+                        error_message=str(e),
+                        processing_time=time.time() - start_time
+                    )
+        
+        return results
+    
+    def _split_ocr_pages(self, data: Dict[str, List[Any]]) -> Dict[int, Dict[str, List[Any]]]:
+        """
+        Split multi-page Tesseract data into per-page column dicts
+        
+        Args:
+            data: pytesseract image_to_data output (Output.DICT)
+        
+        Returns:
+            Dictionary mapping 1-based page number to that page's data
+        """
+        pages: Dict[int, Dict[str, List[Any]]] = {}
+        keys = list(data.keys())
+        for row in zip(*(data[key] for key in keys)):
+            record = dict(zip(keys, row))
+            page = pages.setdefault(int(record['page_num']), {key: [] for key in keys})
+            for key in keys:
+                page[key].append(record[key])
+        return pages
+    
+    def _build_result(
+        self,
+        file_path: str,
+        metadata: Dict[str, Any],
+        text_content: str,
+        confidence: float,
+        extract_tables: bool,
+        processing_time: float
+    ) -> ProcessingResult:
+        """
+        Assemble the result for one recognized image
+        
+        Args:
+            file_path: Path to image file
+            metadata: File and image metadata
+            text_content: OCR text
+            confidence: Average OCR confidence (0-100)
+            extract_tables: Try to extract tables from the text
+            processing_time: Seconds spent on this image
+        
+        Returns:
+            ProcessingResult with extracted data
+        """
+        warnings = []
+        dataframes = []
+        
+        # Try to extract tables if requested
+        if extract_tables and text_content:
+            tables = self._extract_tables_from_text(text_content)
+            if tables:
+                dataframes.extend(tables)
+            else:
+                warnings.append("No tables could be extracted from OCR text")
+        
+        # Check OCR confidence
+        metadata['ocr_confidence'] = confidence
+        
+        if confidence < 60:
+            warnings.append(
+                f"Low OCR confidence ({confidence}%). "
+                "Consider using a higher quality image."
+            )
+        
+        # Create result
+        result = ProcessingResult(
+            success=True,
+            file_path=file_path,
+            file_type='image',
+            dataframes=dataframes,
+            text_content=text_content,
+            metadata=metadata,
+            processing_time=processing_time,
+            warnings=warnings,
+            sheet_names=[f"Table_{i+1}" for i in range(len(dataframes))]
+        )
+        
+        self.log_processing_info(result)
+        return result
+    
+    def _load_image(self, file_path: str) -> Image.Image:
+        """
+        Decode an image file, reusing a recent decode of the same file version
+        
+        Args:
+            file_path: Path to image file
+        
+        Returns:
+            A private copy of the decoded image (safe to resize or modify)
+        """
+        stat = os.stat(file_path)
+        key = (file_path, stat.st_mtime_ns, stat.st_size)
+        cache = ImageProcessor._image_cache
+        
+        with ImageProcessor._image_cache_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return cached.copy()
+        
+        with Image.open(file_path) as image:
+            image.load()
+            decoded = image.copy()
+        
+        size = _decoded_size(decoded)
+        if size > DECODED_IMAGE_CACHE_BYTES:
+            return decoded
+        
+        with ImageProcessor._image_cache_lock:
+            previous = cache.pop(key, None)
+            if previous is not None:
+                ImageProcessor._image_cache_bytes -= _decoded_size(previous)
+            cache[key] = decoded
+            ImageProcessor._image_cache_bytes += size
+            while ImageProcessor._image_cache_bytes > DECODED_IMAGE_CACHE_BYTES:
+                _, evicted = cache.popitem(last=False)
+                ImageProcessor._image_cache_bytes -= _decoded_size(evicted)
+        
+        return decoded.copy()
+    
     def _get_image_info(self, image: Image.Image) -> Dict[str, Any]:
         """
         Extract image information
@@ -161,93 +453,154 @@ class ImageProcessor(BaseProcessor):
         Returns:
             Preprocessed image
         """
+        return Image.fromarray(self._preprocess_pixels(image))
+    
+    def _preprocess_pixels(self, image: Image.Image) -> np.ndarray:
+        """
+        Preprocess image for better OCR results, as a grayscale pixel array
+        
+        Args:
+            image: PIL Image object
+        
+        Returns:
+            2-D uint8 array of the preprocessed image
+        """
         # Resize if too large
         if image.width > self.max_size[0] or image.height > self.max_size[1]:
             self.logger.info(f"Resizing image from {image.size}")
-            image.thumbnail(self.max_size, Image.Resampling.LANCZOS)
+            
+            # Let libjpeg decode straight to grayscale at a reduced scale (no-op
+            # for other formats or an already loaded image)
+            if image.format == 'JPEG':
+                image.draft('L', self.max_size)
+            
+            # Bilinear is plenty for OCR input and much cheaper than Lanczos
+            image.thumbnail(self.max_size, Image.Resampling.BILINEAR)
         
         # Convert to RGB if necessary
         if image.mode not in ('RGB', 'L'):
             image = image.convert('RGB')
         
-        # Convert to grayscale for better OCR
-        image = image.convert('L')
+        if CV2_AVAILABLE:
+            # Grayscale + contrast on one contiguous buffer
+            pixels = np.asarray(image)
+            gray = pixels if pixels.ndim == 2 else cv2.cvtColor(pixels, cv2.COLOR_RGB2GRAY)
+            
+            # Same as ImageEnhance.Contrast(2.0): stretch away from the mean level,
+            # 2 * p - mean, saturated to 0..255
+            mean = int(gray.mean() + 0.5)
+            return cv2.addWeighted(gray, 2.0, gray, 0.0, -mean)
         
-        # Apply threshold to make text more clear
-        from PIL import ImageEnhance
-        enhancer = ImageEnhance.Contrast(image)
-        image = enhancer.enhance(2.0)
+        # Convert to grayscale for better OCR
+        gray = np.asarray(image.convert('L'))
         
-        return image
+        # ImageEnhance.Contrast(2.0) as a 256-entry lookup table, so the only
+        # full-size allocation is the output array
+        mean = int(gray.mean() + 0.5)
+        lut = np.clip(2 * np.arange(256) - mean, 0, 255).astype(np.uint8)
+        return lut[gray]
     
-    def _extract_text_ocr(
+    def _run_ocr(
         self,
-        image: Image.Image,
+        image: Union[Image.Image, np.ndarray],
         language: str,
         psm: int
-    ) -> str:
+    ) -> Tuple[str, float]:
         """
-        Extract text using Tesseract OCR
+        Recognize an image once, returning its text and mean confidence
         
         Args:
-            image: PIL Image object
+            image: PIL Image object or 2-D uint8 grayscale array
             language: Tesseract language code
             psm: Page segmentation mode
         
         Returns:
-            Extracted text
+            Tuple of (extracted text, average confidence 0-100)
         """
-        if not self.tesseract_available:
-            raise RuntimeError("Tesseract OCR is not installed or not in PATH.")
+        if not TESSEROCR_AVAILABLE:
+            if not self.tesseract_available:
+                raise RuntimeError("Tesseract OCR is not installed or not in PATH.")
             
-        import pytesseract
+            import pytesseract
+            
+            # One Tesseract run gives both the words and their confidences
+            data = pytesseract.image_to_data(
+                image,
+                lang=language,
+                config=f'--psm {psm}',
+                output_type=pytesseract.Output.DICT
+            )
+            return self._text_from_ocr_data(data), self._confidence_from_ocr_data(data)
+        
+        with _tess_api(language) as api:
+            api.SetPageSegMode(psm)
+            if isinstance(image, np.ndarray):
+                # Raw 8-bit grayscale buffer; no PIL round-trip
+                height, width = image.shape
+                api.SetImageBytes(np.ascontiguousarray(image).tobytes(), width, height, 1, width)
+            else:
+                api.SetImage(image)
+            text = api.GetUTF8Text()
+            confidence = api.MeanTextConf()
+        
+        return text.strip(), float(confidence)
+    
+    def _text_from_ocr_data(self, data: Dict[str, List[Any]]) -> str:
+        """
+        Rebuild page text from Tesseract word data
         
-        # Configure Tesseract
-        config = f'--psm {psm}'
+        Words on a line are joined with spaces and lines with newlines, with a
+        blank line between paragraphs, as image_to_string lays them out.
         
-        # Extract text
-        text = pytesseract.image_to_string(
-            image,
-            lang=language,
-            config=config
-        )
+        Args:
+            data: pytesseract image_to_data output (Output.DICT)
         
-        return text.strip()
+        Returns:
+            Extracted text
+        """
+        paragraphs = []
+        lines = []
+        words = []
+        line_key = par_key = None
+        
+        for block, par, line, word in zip(
+            data['block_num'], data['par_num'], data['line_num'], data['text']
+        ):
+            word = (word or '').strip()
+            if not word:
+                continue
+            
+            if (block, par, line) != line_key:
+                if words:
+                    lines.append(' '.join(words))
+                    words = []
+                if (block, par) != par_key and lines:
+                    paragraphs.append('\n'.join(lines))
+                    lines = []
+                line_key, par_key = (block, par, line), (block, par)
+            words.append(word)
+        
+        if words:
+            lines.append(' '.join(words))
+        if lines:
+            paragraphs.append('\n'.join(lines))
+        
+        return '\n\n'.join(paragraphs)
     
-    def _get_ocr_confidence(self, image: Image.Image, language: str) -> float:
+    def _confidence_from_ocr_data(self, data: Dict[str, List[Any]]) -> float:
         """
-        Get OCR confidence score
+        Average word confidence from Tesseract data, ignoring non-word (-1) entries
         
         Args:
-            image: PIL Image object
-            language: Tesseract language code
+            data: pytesseract image_to_data output (Output.DICT)
         
         Returns:
             Average confidence score (0-100)
         """
-        try:
-            import pytesseract
-            
-            # Get detailed data with confidence scores
-            data = pytesseract.image_to_data(
-                image,
-                lang=language,
-                output_type=pytesseract.Output.DICT
-            )
-            
-            # Calculate average confidence (excluding -1 values)
-            confidences = [
-                float(conf) for conf in data['conf'] 
-                if conf != -1 and conf != '-1' and conf is not None
-            ]
-            
-            if confidences:
-                return sum(confidences) / len(confidences)
-            return 0.0
-        
-        except Exception as e:
-            self.logger.warning(f"Could not get OCR confidence: {str(e)}")
-            return 0.0
+        # None becomes NaN, which the >= 0 mask drops along with the -1 entries
+        confidences = np.asarray(data['conf'], dtype=np.float64)
+        confidences = confidences[confidences >= 0]
+        return float(confidences.mean()) if confidences.size else 0.0
     
     def _extract_tables_from_text(self, text: str) -> List[pd.DataFrame]:
         """
@@ -278,9 +631,12 @@ class ImageProcessor(BaseProcessor):
             Dictionary with text and layout data
         """
         try:
+            if not self.pytesseract_available:
+                raise RuntimeError("Tesseract OCR is not installed or not in PATH.")
+            
             import pytesseract
             
-            image = Image.open(file_path)
+            image = self._load_image(file_path)
             
             # Preprocess
             image = self._preprocess_image(image)
@@ -292,27 +648,20 @@ class ImageProcessor(BaseProcessor):
                 output_type=pytesseract.Output.DICT
             )
             
-            # Organize by blocks
+            # Organize words by block; groupby keeps blocks in reading order
+            words = pd.DataFrame({
+                key: data[key]
+                for key in ('text', 'block_num', 'left', 'top', 'width', 'height', 'conf')
+            })
+            words = words[words['text'].astype(str).str.strip() != '']
+            
             blocks = {}
-            for i in range(len(data['text'])):
-                if data['text'][i].strip():
-                    block_num = data['block_num'][i]
-                    
-                    if block_num not in blocks:
-                        blocks[block_num] = {
-                            'text': [],
-                            'positions': [],
-                            'confidence': []
-                        }
-                    
-                    blocks[block_num]['text'].append(data['text'][i])
-                    blocks[block_num]['positions'].append({
-                        'left': data['left'][i],
-                        'top': data['top'][i],
-                        'width': data['width'][i],
-                        'height': data['height'][i]
-                    })
-                    blocks[block_num]['confidence'].append(data['conf'][i])
+            for block_num, group in words.groupby('block_num', sort=False):
+                blocks[int(block_num)] = {
+                    'text': group['text'].tolist(),
+                    'positions': group[['left', 'top', 'width', 'height']].to_dict('records'),
+                    'confidence': group['conf'].tolist()
+                }
             
             return {
                 'blocks': blocks,
@@ -335,9 +684,12 @@ class ImageProcessor(BaseProcessor):
             Dictionary with orientation info
         """
         try:
+            if not self.pytesseract_available:
+                raise RuntimeError("Tesseract OCR is not installed or not in PATH.")
+            
             import pytesseract
             
-            image = Image.open(file_path)
+            image = self._load_image(file_path)
             
             # Get orientation and script detection
             osd = pytesseract.image_to_osd(image)
@@ -371,8 +723,15 @@ class ImageProcessor(BaseProcessor):
             angle = float(orientation_info.get('Rotate', 0))
             
             if angle != 0:
-                image = Image.open(file_path)
-                rotated = image.rotate(-angle, expand=True)
+                image = self._load_image(file_path)
+                
+                # OSD reports clockwise rotations; cardinal ones are a lossless
+                # transpose instead of a resampling rotate
+                transpose = _CLOCKWISE_TRANSPOSE.get(angle % 360)
+                if transpose is not None:
+                    rotated = image.transpose(transpose)
+                else:
+                    rotated = image.rotate(-angle, expand=True)
                 
                 save_path = output_path or file_path
                 rotated.save(save_path)
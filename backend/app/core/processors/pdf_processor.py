@@ -1,15 +1,73 @@
 #backend/app/core/processors/pdf_processor.py
 
+import os
+import shutil
 import time
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
 import logging
 
-from .base import BaseProcessor, ProcessingResult
+from .base import BaseProcessor, ProcessingResult, PROCESSOR_POOL_WORKERS, run_in_process_pool
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Spread page extraction over worker processes only when there are enough pages to pay for it
+PARALLEL_PAGE_THRESHOLD = 8
+
+# Table detection costs far more per page than text, so it pays off sooner
+PARALLEL_TABLE_PAGE_THRESHOLD = 4
+
+# Character gaps (in points) that still join letters into words / lines
+TEXT_X_TOLERANCE = 3
+TEXT_Y_TOLERANCE = 3
+
+
+def _extract_page(page, want_text: bool, want_tables: bool) -> Tuple[Optional[str], Optional[List[list]]]:
+    """Text and raw table rows of one page; tables are None if their extraction failed"""
+    try:
+        # Plain (non-layout) text; the table finder reuses the same parsed chars
+        text = page.extract_text(
+            x_tolerance=TEXT_X_TOLERANCE, y_tolerance=TEXT_Y_TOLERANCE, layout=False
+        ) if want_text else None
+        
+        tables: Optional[List[list]] = []
+        if want_tables:
+            try:
+                tables = page.extract_tables()
+            except Exception:
+                tables = None
+        
+        return text, tables
+    finally:
+        # Drop the page's parsed chars/rects so long PDFs don't accumulate them
+        page.flush_cache()
+
+
+def _extract_pages(job: Tuple[str, List[int], bool, bool]) -> List[Tuple[Optional[str], Optional[List[list]]]]:
+    """Extract a run of pages with a handle of this worker's own"""
+    import pdfplumber
+    
+    file_path, page_numbers, want_text, want_tables = job
+    with pdfplumber.open(file_path) as pdf:
+        return [
+            _extract_page(pdf.pages[page_num], want_text, want_tables)
+            for page_num in page_numbers
+        ]
+
+
+@lru_cache(maxsize=1)
+def _java_available() -> bool:
+    """Whether a Java runtime for tabula can be found (checked once per process)"""
+    return shutil.which('java') is not None or bool(os.environ.get('JAVA_HOME'))
+
+
+def _split_runs(items: List[int], parts: int) -> List[List[int]]:
+    """Split items into at most `parts` contiguous, near-equal runs"""
+    size = -(-len(items) // parts)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
 
 class PDFProcessor(BaseProcessor):
     """Process PDF files and extract text and tables"""
@@ -51,22 +109,22 @@ class PDFProcessor(BaseProcessor):
             dataframes = []
             warnings = []
             
-            if extract_text:
-                text_content = self._extract_text_with_pdfplumber(
-                    file_path, specific_pages
+            total_pages = None
+            tables = []
+            
+            if extract_text or extract_tables:
+                # One pdfplumber pass over the pages for both text and tables
+                text_content, tables, total_pages = self._extract_with_pdfplumber(
+                    file_path, specific_pages, extract_text, extract_tables
                 )
             
             if extract_tables:
-                # Try pdfplumber first
-                tables = self._extract_tables_with_pdfplumber(
-                    file_path, specific_pages
-                )
-                
+
                 if not tables:
                     # Fallback to tabula
                     self.logger.info("No tables found with pdfplumber, trying tabula...")
                     tables = self._extract_tables_with_tabula(
-                        file_path, specific_pages
+                        file_path, specific_pages, total_pages
                     )
                 
                 # Clean and add tables
@@ -90,17 +148,16 @@ class PDFProcessor(BaseProcessor):
             
             # Check if we hit page limit
             if specific_pages is None:
-                import PyPDF2
-                with open(file_path, 'rb') as f:
-                    pdf_reader = PyPDF2.PdfReader(f)
-                    total_pages = len(pdf_reader.pages)
-                    metadata['total_pages'] = total_pages
-                    
-                    if total_pages > self.max_pages:
-                        warnings.append(
-                            f"PDF has {total_pages} pages, but only first "
-                            f"{self.max_pages} were processed (limit)"
-                        )
+                if total_pages is None:
+                    # pdfplumber pass was skipped or failed, so nothing has counted the pages yet
+                    total_pages = self.get_page_count(file_path)
+                metadata['total_pages'] = total_pages
+                
+                if total_pages > self.max_pages:
+                    warnings.append(
+                        f"PDF has {total_pages} pages, but only first "
+                        f"{self.max_pages} were processed (limit)"
+                    )
             
             # Create result
             result = ProcessingResult(
@@ -128,91 +185,86 @@ class PDFProcessor(BaseProcessor):
                 processing_time=time.time() - start_time
             )
     
-    def _extract_text_with_pdfplumber(
+    def _extract_with_pdfplumber(
         self,
         file_path: str,
-        pages: Optional[List[int]] = None
-    ) -> str:
+        pages: Optional[List[int]] = None,
+        want_text: bool = True,
+        want_tables: bool = True
+    ) -> Tuple[str, List[Dict[str, Any]], Optional[int]]:
         """
-        Extract text using pdfplumber
+        Extract text and tables with pdfplumber in a single pass over the pages
         
         Args:
             file_path: Path to PDF
             pages: Specific pages to extract (None = all pages)
+            want_text: Extract page text
+            want_tables: Extract page tables
         
         Returns:
-            Extracted text content
+            Tuple of (text content, tables as {'df', 'page'} dicts,
+            total page count or None if the PDF could not be read)
         """
         try:
             import pdfplumber
             
-            text_content = []
-            
             with pdfplumber.open(file_path) as pdf:
                 total_pages = len(pdf.pages)
                 pages_to_process = pages if pages else range(min(total_pages, self.max_pages))
+                pages_to_process = [page_num for page_num in pages_to_process if page_num < total_pages]
+                
+                threshold = PARALLEL_TABLE_PAGE_THRESHOLD if want_tables else PARALLEL_PAGE_THRESHOLD
+                parallel = len(pages_to_process) >= threshold
                 
-                for page_num in pages_to_process:
-                    if page_num < total_pages:
-                        page = pdf.pages[page_num]
-                        text = page.extract_text()
-                        if text:
-                            text_content.append(f"--- Page {page_num + 1} ---\n{text}\n")
+                if not parallel:
+                    extracted = [
+                        _extract_page(pdf.pages[page_num], want_text, want_tables)
+                        for page_num in pages_to_process
+                    ]
             
-            return "\n".join(text_content)
+            if parallel:
+                # pdfminer layout analysis is pure Python, so pages go to worker
+                # processes; each opens its own handle on a contiguous run of pages
+                runs = _split_runs(
+                    pages_to_process, min(PROCESSOR_POOL_WORKERS, os.cpu_count() or 1)
+                )
+                results = run_in_process_pool(
+                    _extract_pages,
+                    [(file_path, run, want_text, want_tables) for run in runs]
+                )
+                extracted = [page for run_pages in results for page in run_pages]
         
         except Exception as e:
-            self.logger.error(f"Error extracting text with pdfplumber: {str(e)}")
-            return ""
-    
-    def _extract_tables_with_pdfplumber(
-        self,
-        file_path: str,
-        pages: Optional[List[int]] = None
-    ) -> List[pd.DataFrame]:
-        """
-        Extract tables using pdfplumber
+            self.logger.error(f"Error extracting content with pdfplumber: {str(e)}")
+            return "", [], None
         
-        Args:
-            file_path: Path to PDF
-            pages: Specific pages to extract
+        text_content = []
+        tables = []
         
-        Returns:
-            List of DataFrames containing tables
-        """
-        try:
-            import pdfplumber
+        for page_num, (text, page_tables) in zip(pages_to_process, extracted):
+            if text:
+                text_content.append(f"--- Page {page_num + 1} ---\n{text}\n")
             
-            dataframes = []
+            if page_tables is None:
+                self.logger.error(f"Error extracting tables with pdfplumber on page {page_num + 1}")
+                continue
             
-            with pdfplumber.open(file_path) as pdf:
-                total_pages = len(pdf.pages)
-                pages_to_process = pages if pages else range(min(total_pages, self.max_pages))
-                
-                for page_num in pages_to_process:
-                    if page_num < total_pages:
-                        page = pdf.pages[page_num]
-                        extracted_tables = page.extract_tables()
-                        
-                        for table in extracted_tables:
-                            if table and len(table) > 1:
-                                # Convert to DataFrame
-                                df = pd.DataFrame(table[1:], columns=table[0])
-                                dataframes.append({
-                                    'df': df,
-                                    'page': page_num + 1
-                                })
-            
-            return dataframes
+            for table in page_tables:
+                if table and len(table) > 1:
+                    # Convert to DataFrame
+                    df = pd.DataFrame(table[1:], columns=table[0])
+                    tables.append({
+                        'df': df,
+                        'page': page_num + 1
+                    })
         
-        except Exception as e:
-            self.logger.error(f"Error extracting tables with pdfplumber: {str(e)}")
-            return []
+        return "\n".join(text_content), tables, total_pages
     
     def _extract_tables_with_tabula(
         self,
         file_path: str,
-        pages: Optional[List[int]] = None
+        pages: Optional[List[int]] = None,
+        total_pages: Optional[int] = None
     ) -> List[pd.DataFrame]:
         """
         Extract tables using tabula-py (fallback method)
@@ -220,22 +272,29 @@ class PDFProcessor(BaseProcessor):
         Args:
             file_path: Path to PDF
             pages: Specific pages to extract
+            total_pages: Page count if already known (saves re-reading the PDF)
         
         Returns:
             List of DataFrames containing tables
         """
+        if not _java_available():
+            # tabula shells out to a JVM; don't pay its import/startup just to fail
+            self.logger.warning("Tabula requires Java JRE/JDK which was not found, skipping tabula fallback")
+            return []
+        
         try:
             import tabula
             
             # Get actual page count to avoid "Page number does not exist" error
-            total_pages = 0
-            try:
-                import PyPDF2
-                with open(file_path, 'rb') as f:
-                    pdf_reader = PyPDF2.PdfReader(f)
-                    total_pages = len(pdf_reader.pages)
-            except Exception as e:
-                self.logger.warning(f"Could not get page count for tabula: {e}")
+            if not total_pages and not pages:
+                total_pages = 0
+                try:
+                    import PyPDF2
+                    with open(file_path, 'rb') as f:
+                        pdf_reader = PyPDF2.PdfReader(f)
+                        total_pages = len(pdf_reader.pages)
+                except Exception as e:
+                    self.logger.warning(f"Could not get page count for tabula: {e}")
             
             # Convert page numbers to tabula format (1-indexed, comma-separated)
             if pages:
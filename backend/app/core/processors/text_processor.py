@@ -4,15 +4,24 @@ Handles basic text extraction and table detection from text
 """
 #backend/app/core/processors/text_processor.py
 
+import codecs
+import io
 import time
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import pandas as pd
 
 from .base import BaseProcessor, ProcessingResult
+from .csv_processor import _BOM_ENCODINGS
 
 logger = logging.getLogger(__name__)
 
+# Characters decoded per read when streaming a text file
+TEXT_READ_CHUNK = 1 << 20
+
+# Bytes checked for valid UTF-8, and handed to chardet when that check fails
+CHARDET_SAMPLE_BYTES = 100000
+
 
 class TextProcessor(BaseProcessor):
     """Process plain text files and detect embedded tables"""
@@ -43,23 +52,14 @@ class TextProcessor(BaseProcessor):
             metadata = self.get_file_metadata(file_path)
             
             # Detect encoding (using a helper or standard utf-8)
-            encoding = kwargs.get('encoding')
-            if not encoding:
-                # Try to import from csv_processor helper if available or use chardet
-                try:
-                    import chardet
-                    with open(file_path, 'rb') as f:
-                        raw_data = f.read(100000)
-                        result = chardet.detect(raw_data)
-                        encoding = result['encoding'] or 'utf-8'
-                except:
-                    encoding = 'utf-8'
+            encoding = kwargs.get('encoding') or self._detect_encoding(file_path)
             
             metadata['encoding'] = encoding
             
-            # Read text content
-            with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-                text_content = f.read()
+            # Read text content, counting as it streams in
+            text_content, char_count, line_count, word_count = self._read_text(
+                file_path, encoding
+            )
             
             dataframes = []
             warnings = []
@@ -72,9 +72,9 @@ class TextProcessor(BaseProcessor):
                     warnings.append("No table structures detected in text file")
             
             # Add text statistics to metadata
-            metadata['char_count'] = len(text_content)
-            metadata['line_count'] = len(text_content.splitlines())
-            metadata['word_count'] = len(text_content.split())
+            metadata['char_count'] = char_count
+            metadata['line_count'] = line_count
+            metadata['word_count'] = word_count
             
             # Create result
             result = ProcessingResult(
@@ -101,3 +101,72 @@ class TextProcessor(BaseProcessor):
                 error_message=str(e),
                 processing_time=time.time() - start_time
             )
+    
+    def _detect_encoding(self, file_path: str) -> str:
+        """
+        Detect file encoding, trying a BOM and UTF-8 before chardet
+        
+        Args:
+            file_path: Path to text file
+        
+        Returns:
+            Detected encoding string
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                raw_data = f.read(CHARDET_SAMPLE_BYTES)
+            
+            for bom, bom_encoding in _BOM_ENCODINGS:
+                if raw_data.startswith(bom):
+                    return bom_encoding
+            
+            try:
+                # The whole sample, not just its head: legacy-encoded bytes often
+                # start well into the file. Not final: the sample may end
+                # partway through a character
+                codecs.getincrementaldecoder('utf-8')().decode(raw_data, final=False)
+                return 'utf-8'
+            except UnicodeDecodeError:
+                pass
+            
+            import chardet
+            return chardet.detect(raw_data)['encoding'] or 'utf-8'
+        
+        except Exception as e:
+            self.logger.warning(f"Error detecting encoding: {str(e)}, using UTF-8")
+            return 'utf-8'
+    
+    def _read_text(self, file_path: str, encoding: str) -> Tuple[str, int, int, int]:
+        """
+        Read a text file in chunks, collecting character, line and word counts
+        in the same pass instead of rescanning the full string afterwards
+        
+        Args:
+            file_path: Path to text file
+            encoding: Text encoding
+        
+        Returns:
+            Tuple of (text, char count, line count, word count)
+        """
+        buffer = io.StringIO()
+        char_count = newline_count = word_count = 0
+        last_char = ''
+        
+        # Universal newlines mode folds \r\n and \r into \n, so counting \n
+        # matches splitlines() for ordinary line endings
+        with open(file_path, 'r', encoding=encoding, errors='replace') as f:
+            for chunk in iter(lambda: f.read(TEXT_READ_CHUNK), ''):
+                buffer.write(chunk)
+                char_count += len(chunk)
+                newline_count += chunk.count('\n')
+                word_count += len(chunk.split())
+                
+                # A word cut at the chunk boundary was counted on both sides
+                if last_char and not last_char.isspace() and not chunk[0].isspace():
+                    word_count -= 1
+                last_char = chunk[-1]
+        
+        # A final line without a trailing newline still counts as a line
+        line_count = newline_count + (1 if last_char and last_char != '\n' else 0)
+        
+        return buffer.getvalue(), char_count, line_count, word_count
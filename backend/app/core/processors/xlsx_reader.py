@@ -0,0 +1,84 @@
+"""
+XLSX Reader - Workbook properties read straight from the Office Open XML package
+Used by ExcelProcessor for metadata without loading the workbook through openpyxl
+"""
+#backend/app/core/processors/xlsx_reader.py
+
+import zipfile
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+# SpreadsheetML namespace
+S_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_SHEET = f'{{{S_NS}}}sheet'
+
+# docProps/core.xml namespaces
+_CP_NS = 'http://schemas.openxmlformats.org/package/2006/metadata/core-properties'
+_DC_NS = 'http://purl.org/dc/elements/1.1/'
+_DCTERMS_NS = 'http://purl.org/dc/terms/'
+
+# docProps/core.xml fields, in the shape openpyxl's workbook properties expose them
+_CORE_TEXT_PROPS = {
+    'creator': f'{{{_DC_NS}}}creator',
+    'last_modified_by': f'{{{_CP_NS}}}lastModifiedBy',
+    'title': f'{{{_DC_NS}}}title',
+    'subject': f'{{{_DC_NS}}}subject',
+}
+_CORE_DATE_PROPS = {
+    'created': f'{{{_DCTERMS_NS}}}created',
+    'modified': f'{{{_DCTERMS_NS}}}modified',
+}
+
+
+def _read_member(zf: zipfile.ZipFile, name: str) -> Optional[bytes]:
+    """Inflate one archive member, None if it is absent"""
+    try:
+        return zf.read(name)
+    except KeyError:
+        return None
+
+
+def read_xlsx_metadata(file_path: str) -> Dict[str, Any]:
+    """
+    Read sheet names and document properties without loading the workbook
+    
+    Only xl/workbook.xml and docProps/core.xml are inflated; no worksheet
+    or shared-string part is touched.
+    
+    Args:
+        file_path: Path to workbook
+    
+    Returns:
+        Dictionary with sheet_count, sheet_names and core properties
+    """
+    from lxml import etree
+    
+    with zipfile.ZipFile(file_path) as zf:
+        workbook = etree.fromstring(zf.read('xl/workbook.xml'))
+        core = _read_member(zf, 'docProps/core.xml')
+    
+    sheet_names = [sheet.get('name') for sheet in workbook.iter(_SHEET)]
+    metadata: Dict[str, Any] = {
+        'sheet_count': len(sheet_names),
+        'sheet_names': sheet_names,
+    }
+    
+    if not core:
+        return metadata
+    
+    root = etree.fromstring(core)
+    
+    for key, tag in _CORE_DATE_PROPS.items():
+        value = (root.findtext(tag) or '').strip()
+        metadata[key] = None
+        if value:
+            # Naive UTC, matching openpyxl's workbook properties
+            stamp = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            if stamp.tzinfo is not None:
+                stamp = stamp.astimezone(timezone.utc).replace(tzinfo=None)
+            metadata[key] = str(stamp)
+    
+    for key, tag in _CORE_TEXT_PROPS.items():
+        metadata[key] = root.findtext(tag)
+    
+    return metadata
@@ -8,7 +8,14 @@ import shutil
 import logging
 from typing import List, Dict, Any, Optional
 
-from .base import BaseProcessor, ProcessingResult
+from .base import BaseProcessor, ProcessingResult, iter_in_pool
+from app.config import settings
+
+# Archive folders whose contents are never processed (hidden '.' folders are skipped too)
+_SKIP_DIRS = frozenset({'__MACOSX'})
+
+# Entries smaller than this are exempt from the compression-ratio check
+ZIP_RATIO_CHECK_MIN_SIZE = 1024 * 1024
 
 
 class ZipProcessor(BaseProcessor):
@@ -35,15 +42,52 @@ class ZipProcessor(BaseProcessor):
         temp_dir = tempfile.mkdtemp()
         
         try:
-            # 1. Extract zip file
+            # Lazy import to avoid circular dependency
+            # We need to import the processor registry here because __init__ imports this module
+            from . import PROCESSOR_MAP
+            
+            # 1. Scan the archive and extract only the entries we can process
+            tasks = []
             try:
                 with zipfile.ZipFile(file_path, 'r') as zip_ref:
                     # Security check: Don't extract if too many files (Zip bomb protection)
-                    file_list = zip_ref.namelist()
-                    if len(file_list) > 5:
-                        raise ValueError(f"Zip contains too many files ({len(file_list)}). Max 5 allowed(Total of 100MB, make sure to compress files before uploading).")
+                    infos = zip_ref.infolist()
+                    if len(infos) > 5:
+                        raise ValueError(f"Zip contains too many files ({len(infos)}). Max 5 allowed(Total of 100MB, make sure to compress files before uploading).")
                     
-                    zip_ref.extractall(temp_dir)
+                    # Reject bombs from the central directory alone, before inflating anything
+                    self._check_uncompressed_sizes(infos)
+                    
+                    for info in infos:
+                        if info.is_dir():
+                            continue
+                        
+                        # Skip invisible folders and __MACOSX
+                        *folders, filename = info.filename.split('/')
+                        if any(d[:1] == '.' or d in _SKIP_DIRS for d in folders):
+                            continue
+                        
+                        # Skip hidden files
+                        if filename[:1] in ('', '.'):
+                            continue
+                        
+                        file_ext = filename.split('.')[-1].lower() if '.' in filename else ''
+                        
+                        # Unsupported file types are skipped with a dict lookup (no
+                        # ValueError per file) and never written to disk
+                        processor_class = PROCESSOR_MAP.get(file_ext)
+                        if processor_class is None:
+                            continue
+                        
+                        if info.file_size > settings.MAX_FILE_SIZE:
+                            result.warnings.append(f"Skipped {filename}: exceeds the maximum file size")
+                            continue
+                        
+                        # extract() sanitizes the member path, so entries can't escape temp_dir
+                        full_path = zip_ref.extract(info, temp_dir)
+                        # A fresh instance per file: members are processed concurrently
+                        # and processors keep per-call state
+                        tasks.append((filename, full_path, processor_class()))
             except zipfile.BadZipFile:
                 result.error_message = "Invalid or corrupted zip file"
                 return result
@@ -51,76 +95,65 @@ class ZipProcessor(BaseProcessor):
                 result.error_message = f"Error extracting zip: {str(e)}"
                 return result
             
-            # 2. Iterate through extracted files
-            processed_files_count = 0
+            # 2. Process the extracted files concurrently; sub-processors spend most
+            # of their time in C parsers and I/O that release the GIL
+            def process_entry(task):
+                _, full_path, processor = task
+                try:
+                    return processor.process(full_path)
+                except Exception as e:
+                    return e
             
-            # Lazy import to avoid circular dependency
-            # We need to import the factory function here because __init__ imports this module
-            from . import get_processor
+            sub_results = iter_in_pool(process_entry, tasks)
+            
+            # 3. Aggregate in archive order, each file as soon as it (and the
+            # ones before it) are done, while later files are still processing
+            processed_files_count = 0
+            text_chunks = []
             
-            for root, dirs, files in os.walk(temp_dir):
-                # Skip invisible folders and __MACOSX
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__MACOSX']
+            for (filename, _, _), sub_result in zip(tasks, sub_results):
+                if isinstance(sub_result, Exception):
+                    result.warnings.append(f"Error processing {filename}: {str(sub_result)}")
+                    continue
                 
-                for filename in files:
-                    # Skip hidden files
-                    if filename.startswith('.'):
-                        continue
+                try:
+                    if sub_result.success:
+                        processed_files_count += 1
                         
-                    file_ext = filename.split('.')[-1].lower() if '.' in filename else ''
-                    full_path = os.path.join(root, filename)
-                    
-                    # Skip the zip file itself if it somehow got in there (unlikely in temp dir)
-                    if full_path == file_path:
-                        continue
+                        # Aggregate Dataframes
+                        # Rename sheets to include filename context if multiple files:
+                        # if sheet name is generic (Sheet_1), prefix with filename.
+                        # If we have multiple files, we definitely want to distinguish them
+                        # Clean filename for sheet name (remove ext)
+                        clean_filename = os.path.splitext(filename)[0]
+                        sheet_names = sub_result.sheet_names[:len(sub_result.dataframes)]
                         
-                    try:
-                        # Attempt to get a processor for this file type
-                        try:
-                            processor = get_processor(file_ext)
-                        except ValueError:
-                            # Unsupported file type
-                            continue
-                            
-                        # Process the file
-                        sub_result = processor.process(full_path)
+                        result.dataframes.extend(sub_result.dataframes[:len(sheet_names)])
+                        result.sheet_names.extend(
+                            f"{clean_filename} - {sheet_name}" for sheet_name in sheet_names
+                        )
+                        
+                        # Aggregate Text Content
+                        # (collected and joined once, not re-concatenated per file)
+                        if sub_result.text_content:
+                            header = f"\n\n--- Content from {filename} ---\n\n"
+                            text_chunks.append(header if text_chunks else header.strip())
+                            text_chunks.append(sub_result.text_content)
+                        
+                        # Aggregate Metadata?
+                        # Maybe just keep a list of processed files in metadata
+                        processed_list = result.metadata.get("processed_files", [])
+                        processed_list.append(filename)
+                        result.metadata["processed_files"] = processed_list
                         
-                        if sub_result.success:
-                            processed_files_count += 1
-                            
-                            # Aggregate Dataframes
-                            # Rename sheets to include filename context if multiple files
-                            for i, df in enumerate(sub_result.dataframes):
-                                # If sheet name is generic (Sheet_1), prefix with filename
-                                # If we have multiple files, we definitely want to distinguish them
-                                sheet_name = sub_result.sheet_names[i]
-                                
-                                # Clean filename for sheet name (remove ext)
-                                clean_filename = os.path.splitext(filename)[0]
-                                new_sheet_name = f"{clean_filename} - {sheet_name}"
-                                
-                                result.dataframes.append(df)
-                                result.sheet_names.append(new_sheet_name)
-                                
-                            # Aggregate Text Content
-                            if sub_result.text_content:
-                                header = f"\n\n--- Content from {filename} ---\n\n"
-                                if result.text_content:
-                                    result.text_content += header + sub_result.text_content
-                                else:
-                                    result.text_content = header.strip() + sub_result.text_content
-                            
-                            # Aggregate Metadata?
-                            # Maybe just keep a list of processed files in metadata
-                            processed_list = result.metadata.get("processed_files", [])
-                            processed_list.append(filename)
-                            result.metadata["processed_files"] = processed_list
-                            
-                        else:
-                            result.warnings.append(f"Failed to process {filename}: {sub_result.error_message}")
-                            
-                    except Exception as e:
-                        result.warnings.append(f"Error processing {filename}: {str(e)}")
+                    else:
+                        result.warnings.append(f"Failed to process {filename}: {sub_result.error_message}")
+                        
+                except Exception as e:
+                    result.warnings.append(f"Error processing {filename}: {str(e)}")
+            
+            if text_chunks:
+                result.text_content = "".join(text_chunks)
             
             if processed_files_count == 0:
                 result.error_message = "No valid processing targets found in zip file"
@@ -138,3 +171,31 @@ class ZipProcessor(BaseProcessor):
         finally:
             # Cleanup temp directory
             shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    def _check_uncompressed_sizes(self, infos: List[zipfile.ZipInfo]):
+        """
+        Reject archives whose declared sizes point to a zip bomb
+        
+        Args:
+            infos: Archive entries from ZipFile.infolist()
+        
+        Raises:
+            ValueError: If the total uncompressed size or an entry's
+                compression ratio is over the configured limit
+        """
+        total_size = sum(info.file_size for info in infos)
+        if total_size > settings.ZIP_MAX_UNCOMPRESSED_SIZE:
+            raise ValueError(
+                f"Zip expands to {total_size / (1024 * 1024):.0f}MB, more than the "
+                f"{settings.ZIP_MAX_UNCOMPRESSED_SIZE / (1024 * 1024):.0f}MB allowed"
+            )
+        
+        for info in infos:
+            # Small entries can legitimately compress very well (e.g. sparse CSVs)
+            if info.file_size < ZIP_RATIO_CHECK_MIN_SIZE:
+                continue
+            ratio = info.file_size / max(info.compress_size, 1)
+            if ratio > settings.ZIP_MAX_COMPRESSION_RATIO:
+                raise ValueError(
+                    f"Zip entry {info.filename} has a suspicious compression ratio ({ratio:.0f}:1)"
+                )
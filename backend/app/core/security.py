@@ -1,21 +1,35 @@
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Any, Union, Optional
+import bcrypt
 from jose import jwt
-from passlib.context import CryptContext
 from app.config import settings
 
-# Password hashing configuration
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# JWT settings, bound once instead of looked up on every token
+_JWT_SECRET_KEY = settings.JWT_SECRET_KEY
+_JWT_ALGORITHM = settings.JWT_ALGORITHM
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+_EXPIRATION_SECONDS = timedelta(minutes=settings.JWT_EXPIRATION_MINUTES).total_seconds()
+
+# bcrypt only hashes the first 72 bytes; longer passwords are truncated
+# (as passlib did) rather than rejected
+BCRYPT_MAX_PASSWORD_BYTES = 72
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(
+        plain_password.encode('utf-8')[:BCRYPT_MAX_PASSWORD_BYTES],
+        hashed_password.encode('utf-8')
+    )
 
 def get_password_hash(password: str) -> str:
     """
     Generate a bcrypt hash of the password
     """
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode('utf-8')[:BCRYPT_MAX_PASSWORD_BYTES],
+        bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    ).decode('utf-8')
 
 def create_access_token(
     subject: Union[str, Any], expires_delta: Optional[timedelta] = None
@@ -27,17 +41,11 @@ def create_access_token(
         subject: The unique identifier for the user (usually user_id or email)
         expires_delta: Optional expiration time delta
     """
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.JWT_EXPIRATION_MINUTES
-        )
+    expires_in = expires_delta.total_seconds() if expires_delta else _EXPIRATION_SECONDS
     
-    to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-    )
+    # Integer epoch seconds, which is what jose would convert a datetime to
+    to_encode = {"exp": int(time.time() + expires_in), "sub": str(subject)}
+    encoded_jwt = jwt.encode(to_encode, _JWT_SECRET_KEY, algorithm=_JWT_ALGORITHM)
     return encoded_jwt
 
 def decode_access_token(token: str) -> Optional[dict]:
@@ -48,9 +56,7 @@ def decode_access_token(token: str) -> Optional[dict]:
         The decoded payload or None if invalid
     """
     try:
-        decoded_token = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
-        return decoded_token if decoded_token["exp"] >= datetime.utcnow().timestamp() else None
+        decoded_token = jwt.decode(token, _JWT_SECRET_KEY, algorithms=_JWT_ALGORITHMS)
+        return decoded_token if decoded_token["exp"] >= time.time() else None
     except Exception:
         return None
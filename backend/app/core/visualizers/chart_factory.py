@@ -4,8 +4,11 @@ Simplifies chart generation with intelligent defaults
 """
 #backend/app/core/visualizers/chart_factory.py
 
+import re
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Union
 from enum import Enum
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import logging
@@ -14,6 +17,15 @@ from .plotly_generator import PlotlyGenerator, ChartConfig
 
 logger = logging.getLogger(__name__)
 
+# create() kwargs that map onto ChartConfig fields rather than generator options
+_STANDARD_CONFIG_KWARGS = frozenset({
+    'color', 'size', 'x_label', 'y_label', 'width', 'height',
+    'color_palette', 'theme', 'show_legend', 'hover_data', 'options', 'title', 'description'
+})
+
+# Runs of whitespace, hyphens and underscores in a chart type name
+_CHART_TYPE_SEPARATORS = re.compile(r'[\s\-_]+')
+
 
 class ChartType(str, Enum):
     """Supported chart types"""
@@ -35,31 +47,62 @@ class ChartType(str, Enum):
     TRIPLE_AREA = "triple_area"
 
 
+@lru_cache(maxsize=64)
+def _normalize_chart_type(chart_type: str) -> ChartType:
+    """
+    Map a user-supplied chart type name to a ChartType (memoized)
+    
+    Args:
+        chart_type: Chart type name, e.g. 'Bar', 'multi-line'
+    
+    Returns:
+        Matching ChartType
+    
+    Raises:
+        ValueError: If the chart type is not supported
+    """
+    # Normalize chart type: lowercase, replace separators with underscore, collapse multiple underscores
+    normalized = _CHART_TYPE_SEPARATORS.sub('_', chart_type.lower().strip())
+    
+    try:
+        return ChartType(normalized)
+    except ValueError:
+        raise ValueError(
+            f"Unsupported chart type: {normalized}. "
+            f"Supported types: {[t.value for t in ChartType]}"
+        )
+
+
 class ChartFactory:
     """Factory for creating charts with intelligent defaults"""
     
+    # Map chart types to generator method names (resolved per call, so no
+    # bound methods are built for chart types a request never uses)
+    _GENERATOR_METHODS = {
+        ChartType.BAR: 'generate_bar_chart',
+        ChartType.LINE: 'generate_line_chart',
+        ChartType.HISTOGRAM: 'generate_histogram',
+        ChartType.BOX: 'generate_box_plot',
+        ChartType.VIOLIN: 'generate_violin_plot',
+        ChartType.PIE: 'generate_pie_chart',
+        ChartType.DONUT: 'generate_donut_chart',
+        ChartType.AREA: 'generate_area_chart',
+        ChartType.BUBBLE: 'generate_bubble_chart',
+        ChartType.SUNBURST: 'generate_sunburst',
+        ChartType.TREEMAP: 'generate_treemap',
+        ChartType.GAUGE: 'generate_gauge',
+        ChartType.METRIC_AREA: 'generate_metric_area_chart',
+        ChartType.TRIPLE_AREA: 'generate_triple_area_chart',
+    }
+    
+    # Chart types built by the factory itself rather than the generator
+    _FACTORY_METHODS = {
+        ChartType.MULTI_LINE: 'create_multi_line',
+    }
+    
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.generator = PlotlyGenerator()
-        
-        # Map chart types to generator methods
-        self.chart_methods = {
-            ChartType.BAR: self.generator.generate_bar_chart,
-            ChartType.LINE: self.generator.generate_line_chart,
-            ChartType.HISTOGRAM: self.generator.generate_histogram,
-            ChartType.BOX: self.generator.generate_box_plot,
-            ChartType.VIOLIN: self.generator.generate_violin_plot,
-            ChartType.PIE: self.generator.generate_pie_chart,
-            ChartType.DONUT: self.generator.generate_donut_chart,
-            ChartType.AREA: self.generator.generate_area_chart,
-            ChartType.BUBBLE: self.generator.generate_bubble_chart,
-            ChartType.SUNBURST: self.generator.generate_sunburst,
-            ChartType.TREEMAP: self.generator.generate_treemap,
-            ChartType.GAUGE: self.generator.generate_gauge,
-            ChartType.MULTI_LINE: self.create_multi_line,
-            ChartType.METRIC_AREA: self.generator.generate_metric_area_chart,
-            ChartType.TRIPLE_AREA: self.generator.generate_triple_area_chart,
-        }
     
     def create(
         self,
@@ -83,20 +126,9 @@ class ChartFactory:
             Plotly Figure object
         """
         try:
-            # Normalize chart type
-            # Normalize chart type: lowercase, replace separators with underscore, collapse multiple underscores
-            import re
-            chart_type = chart_type.lower().strip()
-            chart_type = re.sub(r'[\s\-_]+', '_', chart_type)
-            
-            # Validate chart type
-            try:
-                chart_enum = ChartType(chart_type)
-            except ValueError:
-                raise ValueError(
-                    f"Unsupported chart type: {chart_type}. "
-                    f"Supported types: {[t.value for t in ChartType]}"
-                )
+            # Normalize and validate chart type
+            chart_enum = _normalize_chart_type(chart_type)
+            chart_type = chart_enum.value
             
             # Infer missing parameters
             if not x and not y and chart_enum != ChartType.CORRELATION_HEATMAP:
@@ -115,7 +147,7 @@ class ChartFactory:
             )
             
             # Get generator method
-            method = self.chart_methods.get(chart_enum)
+            method = self._get_chart_method(chart_enum)
             if not method:
                 raise ValueError(f"No generator found for chart type: {chart_type}")
             
@@ -129,6 +161,14 @@ class ChartFactory:
             self.logger.error(f"Error creating chart: {str(e)}")
             raise
     
+    def _get_chart_method(self, chart_enum: ChartType):
+        """Resolve the bound method that draws a chart type, or None"""
+        name = self._GENERATOR_METHODS.get(chart_enum)
+        if name:
+            return getattr(self.generator, name)
+        name = self._FACTORY_METHODS.get(chart_enum)
+        return getattr(self, name) if name else None
+    
     def _build_config(
         self,
         chart_type: str,
@@ -148,13 +188,9 @@ class ChartFactory:
         options = kwargs.get('options', {}).copy()
         
         # Merge other specialized kwargs into options if they aren't standard ChartConfig fields
-        standard_fields = {
-            'color', 'size', 'x_label', 'y_label', 'width', 'height', 
-            'color_palette', 'theme', 'show_legend', 'hover_data', 'options', 'title', 'description'
-        }
-        for k, v in kwargs.items():
-            if k not in standard_fields:
-                options[k] = v
+        options.update(
+            (k, v) for k, v in kwargs.items() if k not in _STANDARD_CONFIG_KWARGS
+        )
 
         config = ChartConfig(
             chart_type=chart_type,
@@ -187,9 +223,24 @@ class ChartFactory:
         if len(df.columns) < 1:
             raise ValueError("DataFrame must have at least one column to generate a chart.")
 
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-        categorical_cols = df.select_dtypes(exclude=['number', 'datetime']).columns.tolist()
-        datetime_cols = [c for c in df.columns if pd.api.types.is_datetime64_any_dtype(df[c])]
+        # Classify columns in one pass over the dtypes by kind code:
+        # numbers (ints, floats, complex, timedeltas) as select_dtypes('number') does,
+        # datetimes with or without a timezone, and everything else as categorical.
+        # Only naive datetimes are kept out of the categoricals, as
+        # select_dtypes(exclude='datetime') did.
+        numeric_cols = []
+        categorical_cols = []
+        datetime_cols = []
+        for col, dtype in df.dtypes.items():
+            kind = dtype.kind
+            if kind in 'iufcm':
+                numeric_cols.append(col)
+                continue
+            if kind == 'M':
+                datetime_cols.append(col)
+                if isinstance(dtype, np.dtype):
+                    continue
+            categorical_cols.append(col)
         
         # Default selections based on chart type
         if chart_type in ['histogram', 'box', 'violin']:
@@ -265,11 +316,9 @@ class ChartFactory:
         config: ChartConfig
     ) -> go.Figure:
         """Create donut chart (pie chart with hole)"""
-        # Copy options to avoid side effects
-        from dataclasses import replace
-        new_options = config.options.copy()
-        new_options['hole'] = new_options.get('hole', 0.4)
-        config = replace(config, options=new_options)
+        # _build_config gives every config its own options dict, so it can be
+        # updated in place rather than copying the whole config
+        config.options.setdefault('hole', 0.4)
         return self.generator.generate_pie_chart(df, config)
     
     def create_correlation_matrix(
@@ -291,7 +340,7 @@ class ChartFactory:
         numeric_df = df.select_dtypes(include=['number'])
         if numeric_df.empty or numeric_df.shape[1] < 2:
             raise ValueError("Correlation matrix requires at least 2 numeric columns.")
-        corr_matrix = numeric_df.corr()
+        corr_matrix = self._pearson_corr(numeric_df)
         
         config = ChartConfig(
             chart_type='heatmap',
@@ -306,6 +355,28 @@ class ChartFactory:
         
         return self.generator.generate_heatmap(corr_matrix, config)
     
+    def _pearson_corr(self, numeric_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Pearson correlation matrix, via one np.corrcoef call when possible
+        
+        Args:
+            numeric_df: DataFrame of numeric columns
+        
+        Returns:
+            Correlation matrix DataFrame
+        """
+        if all(dtype.kind in 'iuf' for dtype in numeric_df.dtypes):
+            values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+            
+            # pandas drops missing values pairwise, which corrcoef can't do
+            if not np.isnan(values).any():
+                # Constant columns give NaN, as in DataFrame.corr()
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    corr = np.corrcoef(values, rowvar=False)
+                return pd.DataFrame(corr, index=numeric_df.columns, columns=numeric_df.columns)
+        
+        return numeric_df.corr()
+    
     def create_distribution_plot(
         self,
         df: pd.DataFrame,
@@ -371,6 +442,7 @@ class ChartFactory:
         date_col: str,
         value_col: Union[str, List[str]],
         chart_type: str = 'line',
+        date_format: Optional[str] = None,
         **kwargs
     ) -> go.Figure:
         """
@@ -381,18 +453,22 @@ class ChartFactory:
             date_col: Date column
             value_col: Value column(s)
             chart_type: 'line' or 'area'
+            date_format: strftime format of date_col strings, if known
+                (lets pandas skip format inference)
             **kwargs: Additional options
         
         Returns:
             Plotly Figure
         """
-        # Ensure date column is datetime
-        if not pd.api.types.is_datetime64_any_dtype(df[date_col]):
-            df = df.copy()
-            df[date_col] = pd.to_datetime(df[date_col])
+        # Ensure date column is datetime (assign copies the frame once; cache
+        # parses each distinct date string only once)
+        if df[date_col].dtype.kind != 'M':
+            df = df.assign(**{
+                date_col: pd.to_datetime(df[date_col], format=date_format, cache=True)
+            })
         
-        # Sort by date
-        df = df.sort_values(date_col)
+        # Sort by date (stable, so rows sharing a date keep their order)
+        df = df.sort_values(date_col, kind='mergesort')
         
         title = kwargs.pop("title", 'Time Series')
         return self.create(
@@ -488,20 +564,18 @@ class ChartFactory:
         Returns:
             Plotly Figure
         """
-        # Melt dataframe for multiple lines
-        df_melted = df.melt(
-            id_vars=[x],
-            value_vars=y_columns,
-            var_name='series',
-            value_name='value'
-        )
-        
-        return self.create(
+        # px.line draws one trace per column of a wide frame, so there is no
+        # need to melt it into len(df) * len(y_columns) rows first
+        title = kwargs.pop("title", f'Multi-line Chart: {", ".join(y_columns)}')
+        fig = self.create(
             chart_type='line',
-            df=df_melted,
+            df=df,
             x=x,
-            y='value',
-            color='series',
-            title=kwargs.get('title', f'Multi-line Chart: {", ".join(y_columns)}'),
+            y=list(y_columns),
+            title=title,
             **kwargs
-        )
\ No newline at end of file
+        )
+        
+        # Keep the legend title the long-form version had
+        fig.update_layout(legend_title_text='series')
+        return fig
@@ -5,21 +5,54 @@ Combines charts, layouts, and interactivity
 #backend/app/core/visualizers/dashboard_builder.py
 
 from typing import Dict, Any, List, Optional, Union
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import count, repeat
+from weakref import WeakValueDictionary
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import json
 import logging
 
-from .chart_factory import ChartFactory
+try:
+    import orjson  # faster (de)serialization of figure-sized payloads
+    ORJSON_AVAILABLE = True
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    from plotly_resampler import FigureResampler  # per-view decimation of long traces
+    PLOTLY_RESAMPLER_AVAILABLE = True
+except ImportError:  # plotly-resampler is optional; large traces are shipped in full
+    FigureResampler = None
+    PLOTLY_RESAMPLER_AVAILABLE = False
+
+from .chart_factory import ChartFactory, ChartType, _normalize_chart_type
 from .plotly_generator import PlotlyGenerator
 
 logger = logging.getLogger(__name__)
 
+# Frames longer than this get their line/area traces downsampled (if plotly-resampler is installed)
+RESAMPLE_ROW_THRESHOLD = 10_000
+
+# Points shown per resampled trace unless add_widget is given max_samples
+RESAMPLE_DEFAULT_SAMPLES = 5000
+
+# Chart types built from scatter traces, which plotly-resampler can decimate
+_RESAMPLED_CHART_TYPES = frozenset({
+    ChartType.LINE,
+    ChartType.MULTI_LINE,
+    ChartType.AREA,
+    ChartType.METRIC_AREA,
+    ChartType.TRIPLE_AREA,
+})
 
-@dataclass
+
+@dataclass(slots=True)
 class VizWidget:
     """Single widget in dashboard"""
     id: str
@@ -29,9 +62,75 @@ class VizWidget:
     description: Optional[str] = None
     position: Dict[str, int] = field(default_factory=dict)  # row, col, width, height
     config: Dict[str, Any] = field(default_factory=dict)
+    
+    # Serialized figure and the figure it was built from (see chart_json_text)
+    _json_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _json_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _json_figure: Optional[go.Figure] = field(default=None, init=False, repr=False, compare=False)
+    
+    def chart_json_text(self) -> str:
+        """
+        Figure serialized to a JSON string, once per figure
+        
+        The cache is dropped when `figure` is replaced; after mutating the
+        figure in place, call invalidate_json().
+        
+        Returns:
+            Plotly figure JSON (data, layout)
+        """
+        if self._json_text is None or self._json_figure is not self.figure:
+            self._json_text = self.figure.to_json()
+            self._json_cache = None
+            self._json_figure = self.figure
+        return self._json_text
+    
+    def chart_json(self) -> Dict[str, Any]:
+        """
+        Figure as a JSON-compatible dict, parsed once from chart_json_text()
+        
+        Returns:
+            Plotly figure dict (data, layout)
+        """
+        figure_json = self.chart_json_text()
+        if self._json_cache is None:
+            self._json_cache = orjson.loads(figure_json) if ORJSON_AVAILABLE else json.loads(figure_json)
+        return self._json_cache
+    
+    def invalidate_json(self):
+        """Forget the serialized figure"""
+        self._json_text = None
+        self._json_cache = None
+        self._json_figure = None
+
+
+# Dashboards a builder keeps alive on its own; older ones stay registered only
+# while something else still references them
+RECENT_DASHBOARDS = 64
+
+# Categorical columns with more distinct values are left out of auto dashboards
+AUTO_MAX_CATEGORIES = 50
 
+# Plotly.js config for exported pages (plotly.io copies it, so it is shared safely)
+_EXPORT_CONFIG = {'displayModeBar': True, 'responsive': True}
 
-@dataclass
+# Fonts of the dashboard title and of each widget's subplot title
+_TITLE_FONT = {'size': 20}
+_SUBPLOT_TITLE_FONT = {'size': 16}
+
+# Trace types placed by a paper-coordinate 'domain' rather than x/y axes
+_DOMAIN_TRACE_TYPES = frozenset({
+    'pie', 'sunburst', 'treemap', 'icicle', 'funnelarea', 'indicator',
+})
+
+
+def _dumps_compact(obj: Any) -> str:
+    """Serialize to compact JSON text, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, separators=(',', ':'))
+
+
+@dataclass(slots=True, weakref_slot=True)
 class VizDashboard:
     """Complete dashboard configuration"""
     id: str
@@ -41,6 +140,9 @@ class VizDashboard:
     layout: Dict[str, Any] = field(default_factory=dict)
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    # Last exported grid: (layout key, source objects, grid); see DashboardBuilder._export_grid
+    _grid_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
 
 class DashboardBuilder:
@@ -51,8 +153,11 @@ class DashboardBuilder:
         self.chart_factory = ChartFactory()
         self.generator = PlotlyGenerator()
         
-        # Dashboard registry
-        self.dashboards: Dict[str, VizDashboard] = {}
+        # Dashboard registry: entries vanish once a dashboard is unreferenced,
+        # apart from the most recent ones, which _recent keeps alive
+        self.dashboards: WeakValueDictionary[str, VizDashboard] = WeakValueDictionary()
+        self._recent: OrderedDict[str, VizDashboard] = OrderedDict()
+        self._dashboard_ids = count(1)
     
     def create_dashboard(
         self,
@@ -72,7 +177,7 @@ class DashboardBuilder:
             Dashboard object
         """
         if not dashboard_id:
-            dashboard_id = f"dashboard_{len(self.dashboards) + 1}"
+            dashboard_id = f"dashboard_{next(self._dashboard_ids)}"
         
         dashboard = VizDashboard(
             id=dashboard_id,
@@ -81,6 +186,10 @@ class DashboardBuilder:
         )
         
         self.dashboards[dashboard_id] = dashboard
+        self._recent[dashboard_id] = dashboard
+        self._recent.move_to_end(dashboard_id)
+        if len(self._recent) > RECENT_DASHBOARDS:
+            self._recent.popitem(last=False)
         self.logger.info(f"Created dashboard: {dashboard_id}")
         
         return dashboard
@@ -92,6 +201,7 @@ class DashboardBuilder:
         df: pd.DataFrame,
         widget_id: Optional[str] = None,
         title: Optional[str] = None,
+        max_samples: int = RESAMPLE_DEFAULT_SAMPLES,
         **kwargs
     ) -> VizWidget:
         """
@@ -103,6 +213,7 @@ class DashboardBuilder:
             df: Data for the chart
             widget_id: Optional widget ID
             title: Widget title
+            max_samples: Points per trace kept when a long line/area chart is downsampled
             **kwargs: Additional chart configuration
         
         Returns:
@@ -114,10 +225,18 @@ class DashboardBuilder:
         # Create chart
         fig = self.chart_factory.create(
             chart_type=chart_type,
-            df=df,
+            df=self._with_plain_index(df, kwargs),
             **kwargs
         )
         
+        if (
+            PLOTLY_RESAMPLER_AVAILABLE
+            and len(df) > RESAMPLE_ROW_THRESHOLD
+            and _normalize_chart_type(chart_type) in _RESAMPLED_CHART_TYPES
+        ):
+            # Ship ~max_samples points per trace instead of every row
+            fig = FigureResampler(fig, default_n_shown_samples=max_samples)
+        
         # Create widget
         widget = VizWidget(
             id=widget_id,
@@ -129,10 +248,48 @@ class DashboardBuilder:
         )
         
         dashboard.widgets.append(widget)
+        dashboard._grid_cache = None
         self.logger.info(f"Added widget {widget_id} to dashboard {dashboard.id}")
         
         return widget
     
+    @staticmethod
+    def _with_plain_index(df: pd.DataFrame, chart_kwargs: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Give plotly a frame whose index it never has to look at
+        
+        Plotly converts a labelled index (a DatetimeIndex especially) slowly,
+        so an index referenced by name becomes an ordinary column, and any
+        other non-default index is swapped for a RangeIndex without copying.
+        
+        Args:
+            df: Data for the chart
+            chart_kwargs: add_widget keyword arguments (x, y, color, size)
+        
+        Returns:
+            DataFrame with a RangeIndex
+        """
+        if isinstance(df.index, pd.RangeIndex):
+            return df
+        
+        referenced = set()
+        for key in ('x', 'y', 'color', 'size'):
+            value = chart_kwargs.get(key)
+            if isinstance(value, (list, tuple)):
+                referenced.update(value)
+            elif value is not None:
+                referenced.add(value)
+        
+        index_name = df.index.name
+        if index_name is not None and index_name in referenced and index_name not in df.columns:
+            return df.reset_index()
+        
+        if chart_kwargs.get('x') is None:
+            # Without an x column plotly may plot against the index itself
+            return df
+        
+        return df.set_axis(pd.RangeIndex(len(df)), axis=0, copy=False)
+    
     def create_grid_layout(
         self,
         dashboard: VizDashboard,
@@ -168,13 +325,18 @@ class DashboardBuilder:
             **{k: v for k, v in kwargs.items() if k not in ['vertical_spacing', 'horizontal_spacing']}
         )
         
-        # Add widgets to subplots
+        # Add widgets to subplots; every trace goes in with a single add_traces call
+        traces = []
+        trace_rows = []
+        trace_cols = []
         for idx, widget in enumerate(dashboard.widgets[:rows*cols]):
-            row = (idx // cols) + 1
-            col = (idx % cols) + 1
-            
-            # Add traces
-            fig.add_traces(widget.figure.data, rows=[row]*len(widget.figure.data), cols=[col]*len(widget.figure.data))
+            widget_traces = widget.figure.data
+            traces.extend(widget_traces)
+            trace_rows.extend(repeat((idx // cols) + 1, len(widget_traces)))
+            trace_cols.extend(repeat((idx % cols) + 1, len(widget_traces)))
+        
+        if traces:
+            fig.add_traces(traces, rows=trace_rows, cols=trace_cols)
         
         # Update layout
         fig.update_layout(
@@ -182,7 +344,7 @@ class DashboardBuilder:
                 text=f"<b>{dashboard.title}</b>",
                 x=0.5,
                 xanchor='center',
-                font=dict(size=20)
+                font=_TITLE_FONT
             ),
             height=kwargs.get('height', 300 * rows),
             width=kwargs.get('width', 1200),
@@ -191,6 +353,146 @@ class DashboardBuilder:
         
         return fig
     
+    def _export_grid(
+        self,
+        dashboard: VizDashboard,
+        rows: int,
+        cols: int,
+        fast: bool
+    ) -> Union[go.Figure, Dict[str, Any]]:
+        """
+        Combined grid for export, reused while the dashboard is unchanged
+        
+        The cached grid is keyed on the layout and widget titles, and on the
+        identity of what it was built from: each widget's serialized figure
+        (fast) or its Figure. Replacing a widget's figure or calling
+        VizWidget.invalidate_json() therefore rebuilds it.
+        
+        Args:
+            dashboard: Dashboard with widgets
+            rows: Number of rows
+            cols: Number of columns
+            fast: Build with _fast_grid rather than create_grid_layout
+        
+        Returns:
+            Figure dict (fast) or Figure
+        """
+        widgets = dashboard.widgets[:rows*cols]
+        key = (fast, rows, cols, dashboard.title, tuple(w.title for w in widgets))
+        sources = tuple(w.chart_json() if fast else w.figure for w in widgets)
+        
+        cached = dashboard._grid_cache
+        if (
+            cached is not None
+            and cached[0] == key
+            and len(cached[1]) == len(sources)
+            and all(old is new for old, new in zip(cached[1], sources))
+        ):
+            return cached[2]
+        
+        if fast:
+            grid = self._fast_grid(dashboard, rows, cols)
+        else:
+            grid = self.create_grid_layout(dashboard, rows, cols)
+        
+        dashboard._grid_cache = (key, sources, grid)
+        return grid
+    
+    def _fast_grid(
+        self,
+        dashboard: VizDashboard,
+        rows: int,
+        cols: int,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Grid layout as a plain figure dict, skipping plotly's figure machinery
+        
+        Lays out the same axes, subplot titles and dashboard title as
+        create_grid_layout, but reuses each widget's serialized figure
+        (VizWidget.chart_json) instead of copying and validating every trace.
+        Pie-like traces are placed through their domain, so unlike
+        create_grid_layout this also accepts donut/pie/gauge widgets.
+        
+        Args:
+            dashboard: Dashboard with widgets
+            rows: Number of rows
+            cols: Number of columns
+            **kwargs: vertical_spacing, horizontal_spacing, height, width, showlegend
+        
+        Returns:
+            Figure dict ({'data', 'layout'}) for plotly.io with validate=False
+        """
+        if not dashboard.widgets:
+            raise ValueError("Dashboard has no widgets")
+        
+        vertical_spacing = kwargs.get('vertical_spacing', 0.1)
+        horizontal_spacing = kwargs.get('horizontal_spacing', 0.1)
+        
+        # Cell sizes and offsets as make_subplots computes them (rows run top to bottom)
+        widths = [(1.0 - horizontal_spacing * (cols - 1)) / cols] * cols
+        heights = [(1.0 - vertical_spacing * (rows - 1)) / rows] * rows
+        
+        layout: Dict[str, Any] = {}
+        domains = []
+        for idx in range(rows * cols):
+            row, col = divmod(idx, cols)
+            x_start = sum(widths[:col]) + col * horizontal_spacing
+            y_start = sum(heights[:rows - 1 - row]) + (rows - 1 - row) * vertical_spacing
+            x_domain = [x_start, x_start + widths[col]]
+            y_domain = [min(max(y_start, 0.0), 1.0), min(max(y_start + heights[-1 - row], 0.0), 1.0)]
+            domains.append((x_domain, y_domain))
+            
+            suffix = str(idx + 1) if idx else ''
+            layout[f'xaxis{suffix}'] = {'anchor': f'y{suffix}', 'domain': x_domain}
+            layout[f'yaxis{suffix}'] = {'anchor': f'x{suffix}', 'domain': y_domain}
+        
+        data = []
+        annotations = []
+        for idx, widget in enumerate(dashboard.widgets[:rows*cols]):
+            x_domain, y_domain = domains[idx]
+            suffix = str(idx + 1) if idx else ''
+            
+            if widget.title:
+                annotations.append({
+                    'font': _SUBPLOT_TITLE_FONT,
+                    'showarrow': False,
+                    'text': widget.title,
+                    'x': sum(x_domain) / 2.0,
+                    'xanchor': 'center',
+                    'xref': 'paper',
+                    'y': y_domain[1],
+                    'yanchor': 'bottom',
+                    'yref': 'paper'
+                })
+            
+            for trace in widget.chart_json().get('data', []):
+                # Shallow copy: the cached trace arrays are shared, never modified
+                trace = dict(trace)
+                if trace.get('type') in _DOMAIN_TRACE_TYPES:
+                    trace['domain'] = {'x': x_domain, 'y': y_domain}
+                else:
+                    trace['xaxis'] = f'x{suffix}'
+                    trace['yaxis'] = f'y{suffix}'
+                data.append(trace)
+        
+        layout['annotations'] = annotations
+        layout['title'] = {
+            'text': f"<b>{dashboard.title}</b>",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': _TITLE_FONT
+        }
+        layout['height'] = kwargs.get('height', 300 * rows)
+        layout['width'] = kwargs.get('width', 1200)
+        layout['showlegend'] = kwargs.get('showlegend', True)
+        
+        if pio.templates.default:
+            # go.Figure would apply the default template; a plain dict must carry it
+            layout['template'] = pio.templates[pio.templates.default].to_plotly_json()
+        
+        return {'data': data, 'layout': layout}
+    
     def create_auto_dashboard(
         self,
         df: pd.DataFrame,
@@ -203,9 +505,21 @@ class DashboardBuilder:
         """
         dashboard = self.create_dashboard(title=title)
         
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-        categorical_cols = df.select_dtypes(exclude=['number', 'datetime']).columns.tolist()
-        datetime_cols = df.select_dtypes(include=['datetime']).columns.tolist()
+        # Bucket the columns in one pass over the dtypes (select_dtypes copies a
+        # sub-frame per call). Numbers exclude bools, as select_dtypes('number')
+        # does, and timezone-aware datetimes count as categorical, as they did
+        # under select_dtypes(exclude=['number', 'datetime']).
+        numeric_cols = []
+        categorical_cols = []
+        datetime_cols = []
+        for col, dtype in df.dtypes.items():
+            kind = dtype.kind
+            if kind in 'iufcm':
+                numeric_cols.append(col)
+            elif kind == 'M' and getattr(dtype, 'tz', None) is None:
+                datetime_cols.append(col)
+            else:
+                categorical_cols.append(col)
         
         # Priority mapping for common column names
         priority_keywords = ["revenue", "sales", "profit", "amount", "total", "count", "value", "sessions", "users", "growth"]
@@ -215,7 +529,13 @@ class DashboardBuilder:
             return sum(5 if k in col_lower else 0 for k in priority_keywords)
             
         sorted_numeric = sorted(numeric_cols, key=score_column, reverse=True)
-        sorted_categorical = sorted(categorical_cols, key=lambda c: df[c].nunique()) # Low cardinality first
+        # Count distinct values once per categorical; columns past the cap
+        # (ids, emails, free text) make unreadable, expensive breakdowns
+        cardinality = {c: df[c].nunique() for c in categorical_cols}
+        sorted_categorical = sorted(
+            (c for c in categorical_cols if cardinality[c] <= AUTO_MAX_CATEGORIES),
+            key=cardinality.__getitem__
+        ) # Low cardinality first
 
         charts_added = 0
         used_metrics = set()
@@ -274,7 +594,7 @@ class DashboardBuilder:
                 self.add_widget(
                     dashboard=dashboard,
                     chart_type='donut',
-                    df=df.groupby(sorted_categorical[0])[metric_to_use].sum().reset_index(),
+                    df=df.groupby(sorted_categorical[0], as_index=False, observed=True)[metric_to_use].sum(),
                     x=sorted_categorical[0],
                     y=metric_to_use,
                     title=f'{metric_to_use} Proportion by {sorted_categorical[0]}',
@@ -289,7 +609,7 @@ class DashboardBuilder:
                     self.add_widget(
                         dashboard=dashboard,
                         chart_type='pie',
-                        df=df.groupby(sorted_categorical[1])[metric_to_use].sum().reset_index(),
+                        df=df.groupby(sorted_categorical[1], as_index=False, observed=True)[metric_to_use].sum(),
                         x=sorted_categorical[1],
                         y=metric_to_use,
                         title=f'{metric_to_use} Breakdown: {sorted_categorical[1]}',
@@ -322,14 +642,14 @@ class DashboardBuilder:
             if charts_added >= max_charts: break
             
             # Skip high cardinality columns for bar charts (prevents "barcode" charts like in user image)
-            if df[cat].nunique() > 15:
+            if cardinality[cat] > 15:
                 continue
                 
             for col in sorted_numeric:
                 if charts_added >= max_charts: break
                 try:
                     # Create a bar chart for categorical vs numeric that hasn't been paired yet
-                    top_df = df.groupby(cat)[col].sum().sort_values(ascending=False).head(10).reset_index()
+                    top_df = df.groupby(cat, observed=True)[col].sum().sort_values(ascending=False).head(10).reset_index()
                     self.add_widget(
                         dashboard=dashboard,
                         chart_type='bar',
@@ -372,10 +692,11 @@ class DashboardBuilder:
         
         # 1. Data types distribution (pie chart)
         if profile_result and hasattr(profile_result, 'type_distribution'):
-            type_df = pd.DataFrame(
-                list(profile_result.type_distribution.items()),
-                columns=['Type', 'Count']
-            )
+            type_distribution = profile_result.type_distribution
+            type_df = pd.DataFrame({
+                'Type': list(type_distribution.keys()),
+                'Count': list(type_distribution.values())
+            })
             self.add_widget(
                 dashboard=dashboard,
                 chart_type='pie',
@@ -386,17 +707,15 @@ class DashboardBuilder:
             )
         
         # 2. Missing data by column (bar chart)
-        missing_data = {}
-        for col in df.columns:
-            missing_pct = (df[col].isnull().sum() / len(df)) * 100
-            if missing_pct > 0:
-                missing_data[col] = missing_pct
-        
-        if missing_data:
-            missing_df = pd.DataFrame(
-                list(missing_data.items()),
-                columns=['Column', 'Missing %']
-            ).sort_values('Missing %', ascending=False)
+        missing = df.isnull().mean().mul(100)
+        missing = missing[missing > 0]
+        
+        if not missing.empty:
+            missing_df = (
+                missing.rename_axis('Column')
+                .reset_index(name='Missing %')
+                .sort_values('Missing %', ascending=False)
+            )
             
             self.add_widget(
                 dashboard=dashboard,
@@ -432,17 +751,17 @@ class DashboardBuilder:
         # 4. Numeric columns summary statistics
         numeric_cols = df.select_dtypes(include=['number']).columns
         if len(numeric_cols) > 0:
-            stats_data = []
-            for col in numeric_cols[:5]:  # Top 5 numeric columns
-                stats_data.append({
-                    'Column': col,
-                    'Mean': df[col].mean(),
-                    'Median': df[col].median(),
-                    'Std': df[col].std()
-                })
+            # Top 5 numeric columns, all three statistics in one aggregate
+            stats_df = (
+                df[numeric_cols[:5]]
+                .agg(['mean', 'median', 'std'])
+                .T
+                .rename(columns={'mean': 'Mean', 'median': 'Median', 'std': 'Std'})
+                .rename_axis('Column')
+                .reset_index()
+            )
             
-            if stats_data:
-                stats_df = pd.DataFrame(stats_data)
+            if not stats_df.empty:
                 stats_melted = stats_df.melt(
                     id_vars=['Column'],
                     var_name='Statistic',
@@ -466,7 +785,8 @@ class DashboardBuilder:
         self,
         dashboard: VizDashboard,
         output_path: str,
-        include_plotlyjs: str = 'cdn'
+        include_plotlyjs: str = 'cdn',
+        fast: bool = True
     ):
         """
         Export dashboard to HTML file
@@ -475,19 +795,23 @@ class DashboardBuilder:
             dashboard: Dashboard to export
             output_path: Output file path
             include_plotlyjs: Plotly JS inclusion method ('cdn', True, False)
+            fast: Assemble the page from the widgets' cached figure JSON
+                instead of building (and validating) a subplot Figure
         """
         # Create grid layout
         rows = (len(dashboard.widgets) + 1) // 2  # 2 columns
         cols = 2 if len(dashboard.widgets) > 1 else 1
         
-        fig = self.create_grid_layout(dashboard, rows, cols)
+        fig = self._export_grid(dashboard, rows, cols, fast)
         
-        # Export to HTML
-        fig.write_html(
+        # Export to HTML (the fast grid is already a plain, trusted figure dict)
+        pio.write_html(
+            fig,
             output_path,
             include_plotlyjs=include_plotlyjs,
             full_html=True,
-            config={'displayModeBar': True, 'responsive': True}
+            config=_EXPORT_CONFIG,
+            validate=not fast
         )
         
         self.logger.info(f"Exported dashboard to {output_path}")
@@ -495,7 +819,8 @@ class DashboardBuilder:
     def export_to_json(
         self,
         dashboard: VizDashboard,
-        output_path: str
+        output_path: str,
+        indent: Optional[int] = 2
     ):
         """
         Export dashboard configuration to JSON
@@ -503,7 +828,13 @@ class DashboardBuilder:
         Args:
             dashboard: Dashboard to export
             output_path: Output file path
+            indent: Indentation for human-readable output; None writes compact JSON
         """
+        if indent is None:
+            self._write_json_stream(dashboard, output_path)
+            self.logger.info(f"Exported dashboard config to {output_path}")
+            return
+        
         # Convert dashboard to dict
         dashboard_dict = {
             'id': dashboard.id,
@@ -517,7 +848,7 @@ class DashboardBuilder:
                     'title': w.title,
                     'description': w.description,
                     'config': w.config,
-                    'chart': json.loads(w.figure.to_json())
+                    'chart': w.chart_json()
                 }
                 for w in dashboard.widgets
             ],
@@ -525,11 +856,58 @@ class DashboardBuilder:
         }
         
         # Write to JSON
-        with open(output_path, 'w') as f:
-            json.dump(dashboard_dict, f, indent=2)
+        if ORJSON_AVAILABLE and indent == 2:
+            options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(dashboard_dict, option=options))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(dashboard_dict, f, indent=indent)
         
         self.logger.info(f"Exported dashboard config to {output_path}")
     
+    def _write_json_stream(self, dashboard: VizDashboard, output_path: str):
+        """
+        Write compact dashboard JSON one widget at a time
+        
+        Each figure's own JSON text is a valid JSON value, so it is written
+        as-is instead of being parsed into the dashboard dict and re-encoded.
+        
+        Args:
+            dashboard: Dashboard to export
+            output_path: Output file path
+        """
+        header = _dumps_compact({
+            'id': dashboard.id,
+            'title': dashboard.title,
+            'description': dashboard.description,
+            'created_at': dashboard.created_at
+        })
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            # Reopen each object before its closing brace to append the remaining key
+            f.write(header[:-1])
+            f.write(',"widgets":[')
+            
+            for idx, w in enumerate(dashboard.widgets):
+                if idx:
+                    f.write(',')
+                fields = _dumps_compact({
+                    'id': w.id,
+                    'chart_type': w.chart_type,
+                    'title': w.title,
+                    'description': w.description,
+                    'config': w.config
+                })
+                f.write(fields[:-1])
+                f.write(',"chart":')
+                f.write(w.chart_json_text())
+                f.write('}')
+            
+            f.write('],"metadata":')
+            f.write(_dumps_compact(dashboard.metadata))
+            f.write('}')
+    
     def get_dashboard(self, dashboard_id: str) -> Optional[VizDashboard]:
         """Get dashboard by ID"""
         return self.dashboards.get(dashboard_id)
@@ -544,13 +922,14 @@ class DashboardBuilder:
                 'widget_count': len(d.widgets),
                 'created_at': d.created_at
             }
-            for d in self.dashboards.values()
+            for d in list(self.dashboards.values())
         ]
     
     def delete_dashboard(self, dashboard_id: str) -> bool:
         """Delete dashboard by ID"""
         if dashboard_id in self.dashboards:
             del self.dashboards[dashboard_id]
+            self._recent.pop(dashboard_id, None)
             self.logger.info(f"Deleted dashboard: {dashboard_id}")
             return True
         return False
\ No newline at end of file
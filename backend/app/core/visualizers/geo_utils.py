@@ -4,6 +4,7 @@ Provides utilities for working with geographic data in visualizations
 """
 #backend/app/core/visualizers/geo_utils.py
 
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
@@ -13,8 +14,8 @@ import re
 logger = logging.getLogger(__name__)
 
 
-# Country name mappings (common variations)
-COUNTRY_MAPPINGS = {
+# Country name mappings (common variations), keyed by stripped lower-case name
+COUNTRY_MAPPINGS = MappingProxyType({
     "usa": "United States",
     "us": "United States",
     "united states of america": "United States",
@@ -25,7 +26,60 @@ COUNTRY_MAPPINGS = {
     "russia": "Russian Federation",
     "south korea": "Korea, Republic of",
     "north korea": "Korea, Democratic People's Republic of",
-}
+})
+
+# ISO 3-letter codes keyed by lower-case canonical name, i.e. the output of
+# normalize_country_names, so every variation in COUNTRY_MAPPINGS resolves too
+ISO_COUNTRY_CODES = MappingProxyType({
+    'united states': 'USA',
+    'united kingdom': 'GBR',
+    'canada': 'CAN',
+    'australia': 'AUS',
+    'germany': 'DEU',
+    'france': 'FRA',
+    'italy': 'ITA',
+    'spain': 'ESP',
+    'china': 'CHN',
+    'japan': 'JPN',
+    'india': 'IND',
+    'brazil': 'BRA',
+    'mexico': 'MEX',
+    'russia': 'RUS',
+    'russian federation': 'RUS',
+    'south africa': 'ZAF',
+    'united arab emirates': 'ARE',
+    'korea, republic of': 'KOR',
+    "korea, democratic people's republic of": 'PRK',
+})
+
+# Lower-case US state names (infer_location_scope)
+US_STATES = frozenset({
+    'alabama', 'alaska', 'arizona', 'arkansas', 'california', 'colorado',
+    'connecticut', 'delaware', 'florida', 'georgia', 'hawaii', 'idaho',
+    'illinois', 'indiana', 'iowa', 'kansas', 'kentucky', 'louisiana',
+    'maine', 'maryland', 'massachusetts', 'michigan', 'minnesota',
+    'mississippi', 'missouri', 'montana', 'nebraska', 'nevada',
+    'new hampshire', 'new jersey', 'new mexico', 'new york',
+    'north carolina', 'north dakota', 'ohio', 'oklahoma', 'oregon',
+    'pennsylvania', 'rhode island', 'south carolina', 'south dakota',
+    'tennessee', 'texas', 'utah', 'vermont', 'virginia', 'washington',
+    'west virginia', 'wisconsin', 'wyoming'
+})
+
+# Column-name keywords per geographic type. Each alternative is a lookahead
+# over the whole name, tried in order, so a name matching several types
+# (e.g. 'country_lat') resolves to the first one listed, as before.
+GEO_PATTERN = re.compile(
+    r'^(?:'
+    r'(?=.*?(?P<latitude>lat))'
+    r'|(?=.*?(?P<longitude>lon))'
+    r'|(?=.*?(?P<country>country|nation))'
+    r'|(?=.*?(?P<state>state|province|region))'
+    r'|(?=.*?(?P<city>city|town|municipality))'
+    r'|(?=.*?(?P<postal_code>zip|postal|postcode))'
+    r')',
+    re.IGNORECASE | re.DOTALL
+)
 
 
 class GeoUtils:
@@ -46,69 +100,59 @@ class GeoUtils:
         geo_columns = {}
         
         for col in df.columns:
-            col_lower = col.lower()
+            match = GEO_PATTERN.match(col) if isinstance(col, str) else None
+            if match is None:
+                continue
             
-            # Latitude detection
-            if any(keyword in col_lower for keyword in ['lat', 'latitude']):
+            geo_type = match.lastgroup
+            
+            if geo_type == 'latitude':
                 if GeoUtils._is_latitude_column(df[col]):
                     geo_columns['latitude'] = col
             
-            # Longitude detection
-            elif any(keyword in col_lower for keyword in ['lon', 'long', 'longitude']):
+            elif geo_type == 'longitude':
                 if GeoUtils._is_longitude_column(df[col]):
                     geo_columns['longitude'] = col
             
-            # Country detection
-            elif any(keyword in col_lower for keyword in ['country', 'nation']):
-                geo_columns['country'] = col
-            
-            # State detection
-            elif any(keyword in col_lower for keyword in ['state', 'province', 'region']):
+            elif geo_type == 'state':
                 if 'state' not in geo_columns:  # Prefer 'state' over 'region'
                     geo_columns['state'] = col
             
-            # City detection
-            elif any(keyword in col_lower for keyword in ['city', 'town', 'municipality']):
-                geo_columns['city'] = col
-            
-            # Postal code
-            elif any(keyword in col_lower for keyword in ['zip', 'postal', 'postcode']):
-                geo_columns['postal_code'] = col
+            else:
+                # country, city, postal_code
+                geo_columns[geo_type] = col
         
         return geo_columns
     
     @staticmethod
     def _is_latitude_column(series: pd.Series) -> bool:
         """Check if column contains valid latitude values"""
-        try:
-            # Convert to numeric
-            numeric_series = pd.to_numeric(series, errors='coerce')
-            
-            # Check if values are in valid latitude range (-90 to 90)
-            valid_mask = (numeric_series >= -90) & (numeric_series <= 90)
-            
-            # At least 80% of non-null values should be valid
-            valid_percentage = valid_mask.sum() / numeric_series.notna().sum()
-            
-            return valid_percentage > 0.8
-        except:
-            return False
+        return GeoUtils._within_range(series, 90)
     
     @staticmethod
     def _is_longitude_column(series: pd.Series) -> bool:
         """Check if column contains valid longitude values"""
+        return GeoUtils._within_range(series, 180)
+    
+    @staticmethod
+    def _within_range(series: pd.Series, limit: float) -> bool:
+        """Whether more than 80% of the numeric values lie within [-limit, limit]"""
         try:
-            # Convert to numeric
-            numeric_series = pd.to_numeric(series, errors='coerce')
+            # One float array; NaN marks values that did not parse as numbers
+            values = pd.to_numeric(series, errors='coerce').to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+            present = ~np.isnan(values)
             
-            # Check if values are in valid longitude range (-180 to 180)
-            valid_mask = (numeric_series >= -180) & (numeric_series <= 180)
+            present_count = np.count_nonzero(present)
+            if present_count == 0:
+                return False
             
-            # At least 80% of non-null values should be valid
-            valid_percentage = valid_mask.sum() / numeric_series.notna().sum()
+            # NaN compares False, so only present values can count as valid
+            valid_count = np.count_nonzero(np.abs(values) <= limit)
             
-            return valid_percentage > 0.8
-        except:
+            return valid_count / present_count > 0.8
+        except Exception:
             return False
     
     @staticmethod
@@ -122,20 +166,20 @@ class GeoUtils:
         Returns:
             Series with normalized country names
         """
-        def normalize_name(name):
-            if pd.isna(name):
-                return name
-            
-            name_lower = str(name).lower().strip()
-            
-            # Check mappings
-            if name_lower in COUNTRY_MAPPINGS:
-                return COUNTRY_MAPPINGS[name_lower]
-            
-            # Title case for standard names
-            return str(name).strip().title()
+        # Normalize each distinct name once; missing values get code -1
+        codes, uniques = pd.factorize(series)
+        names = pd.Series(uniques, dtype=object).astype(str).str.strip()
+        
+        # Known variations via one hash lookup; only the rest are title-cased
+        normalized = names.str.lower().map(COUNTRY_MAPPINGS)
+        unmapped = normalized.isna()
+        normalized[unmapped] = names[unmapped].str.title()
         
-        return series.apply(normalize_name)
+        # Missing values are passed through unchanged
+        present = codes >= 0
+        result = series.astype(object)
+        result[present] = normalized.to_numpy()[codes[present]]
+        return result
     
     @staticmethod
     def validate_coordinates(
@@ -156,15 +200,26 @@ class GeoUtils:
         lat_numeric = pd.to_numeric(lat, errors='coerce')
         lon_numeric = pd.to_numeric(lon, errors='coerce')
         
-        # Create validity mask
-        valid_mask = (
-            lat_numeric.notna() &
-            lon_numeric.notna() &
-            (lat_numeric >= -90) &
-            (lat_numeric <= 90) &
-            (lon_numeric >= -180) &
-            (lon_numeric <= 180)
-        )
+        if not lat_numeric.index.equals(lon_numeric.index):
+            # Misaligned inputs: let pandas align them on the index
+            valid_mask = (
+                lat_numeric.notna() &
+                lon_numeric.notna() &
+                (lat_numeric >= -90) &
+                (lat_numeric <= 90) &
+                (lon_numeric >= -180) &
+                (lon_numeric <= 180)
+            )
+            return lat_numeric, lon_numeric, valid_mask
+        
+        # NaN fails the range test, so |value| <= limit also covers notna();
+        # two comparisons on float arrays instead of six boolean Series
+        lat_values = lat_numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        lon_values = lon_numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        mask = np.abs(lat_values) <= 90
+        mask &= np.abs(lon_values) <= 180
+        
+        valid_mask = pd.Series(mask, index=lat_numeric.index)
         
         return lat_numeric, lon_numeric, valid_mask
     
@@ -210,30 +265,15 @@ class GeoUtils:
         Returns:
             Scope: 'world', 'usa', 'europe', etc.
         """
-        # Get unique locations
-        unique_locations = df[location_column].dropna().unique()
+        # Deduplicate first, then lower-case only the distinct names
+        unique_locations = pd.Series(df[location_column].dropna().unique())
+        locations_lower = unique_locations.astype(str).str.lower().unique()
         
-        if len(unique_locations) == 0:
+        if len(locations_lower) == 0:
             return 'world'
         
-        # Check for US states
-        us_states = {
-            'alabama', 'alaska', 'arizona', 'arkansas', 'california', 'colorado',
-            'connecticut', 'delaware', 'florida', 'georgia', 'hawaii', 'idaho',
-            'illinois', 'indiana', 'iowa', 'kansas', 'kentucky', 'louisiana',
-            'maine', 'maryland', 'massachusetts', 'michigan', 'minnesota',
-            'mississippi', 'missouri', 'montana', 'nebraska', 'nevada',
-            'new hampshire', 'new jersey', 'new mexico', 'new york',
-            'north carolina', 'north dakota', 'ohio', 'oklahoma', 'oregon',
-            'pennsylvania', 'rhode island', 'south carolina', 'south dakota',
-            'tennessee', 'texas', 'utah', 'vermont', 'virginia', 'washington',
-            'west virginia', 'wisconsin', 'wyoming'
-        }
-        
-        locations_lower = {str(loc).lower() for loc in unique_locations}
-        
         # Check if mostly US states
-        us_match = len(locations_lower & us_states) / len(locations_lower)
+        us_match = len(US_STATES.intersection(locations_lower)) / len(locations_lower)
         if us_match > 0.5:
             return 'usa'
         
@@ -251,30 +291,15 @@ class GeoUtils:
         Returns:
             Series with ISO codes
         """
-        # Simple mapping for common countries
-        iso_mapping = {
-            'united states': 'USA',
-            'united kingdom': 'GBR',
-            'canada': 'CAN',
-            'australia': 'AUS',
-            'germany': 'DEU',
-            'france': 'FRA',
-            'italy': 'ITA',
-            'spain': 'ESP',
-            'china': 'CHN',
-            'japan': 'JPN',
-            'india': 'IND',
-            'brazil': 'BRA',
-            'mexico': 'MEX',
-            'russia': 'RUS',
-            'south africa': 'ZAF',
-        }
+        codes, uniques = pd.factorize(countries)
+        names = pd.Series(uniques, dtype=object)
         
-        def get_iso_code(country):
-            if pd.isna(country):
-                return None
-            
-            country_lower = str(country).lower().strip()
-            return iso_mapping.get(country_lower, country)
+        # Resolve through the canonical name; unmapped names are passed through as given
+        keys = GeoUtils.normalize_country_names(names).str.lower()
+        iso_codes = keys.map(ISO_COUNTRY_CODES).fillna(names)
         
-        return countries.apply(get_iso_code)
+        present = codes >= 0
+        result = countries.astype(object)
+        result[present] = iso_codes.to_numpy()[codes[present]]
+        result[~present] = None
+        return result
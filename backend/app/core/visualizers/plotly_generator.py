@@ -18,9 +18,9 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChartConfig:
-    """Configuration for chart generation"""
+    """Configuration for chart generation (one built per chart, never mutated)"""
     # Chart type
     chart_type: str
     
@@ -60,11 +60,11 @@ class ProcessingService:
             
             # Serialize dataframes (with preview)
             serialized_dataframes = []
-            for idx, df in enumerate(result.dataframes):
+            for sheet_name, df in result.iter_sheets():
                 preview_df = df.head(preview_rows)
                 
                 serialized_dataframes.append({
-                    "sheet_name": result.sheet_names[idx] if idx < len(result.sheet_names) else f"Sheet_{idx+1}",
+                    "sheet_name": sheet_name,
                     "rows": len(df),
                     "columns": len(df.columns),
                     "column_names": df.columns.tolist(),
@@ -0,0 +1,13 @@
+#backend/tests/conftest.py
+
+import os
+import sys
+
+# Settings read these at import time; tests don't need a real .env
+os.environ.setdefault("APP_NAME", "AI Dashboard Tests")
+os.environ.setdefault("APP_VERSION", "test")
+os.environ.setdefault("API_V1_PREFIX", "/api/v1")
+os.environ.setdefault("CORS_ORIGINS", "http://localhost")
+os.environ.setdefault("ALLOWED_EXTENSIONS", "csv,xlsx,xls,pdf,docx,txt,json,png,jpg,jpeg,zip")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,52 @@
+#backend/tests/test_docx_processor.py
+
+import pytest
+
+docx = pytest.importorskip("docx")
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+from app.core.processors.docx_processor import _paragraph_text, _table_rows
+
+
+def test_paragraph_text_matches_python_docx():
+    """Break types, hyphens, hyperlinks and nested runs follow Paragraph.text"""
+    document = docx.Document()
+    document.add_paragraph("plain")
+    body = document.element.body
+    body.append(parse_xml(
+        f'<w:p {nsdecls("w")}><w:r>'
+        '<w:t>a</w:t><w:br w:type="page"/><w:t>b</w:t><w:br/><w:t>c</w:t>'
+        '<w:br w:type="column"/><w:noBreakHyphen/>'
+        '<w:ptab w:relativeTo="margin" w:alignment="left" w:leader="none"/>'
+        '<w:tab/><w:cr/>'
+        '</w:r></w:p>'
+    ))
+    body.append(parse_xml(
+        f'<w:p {nsdecls("w", "r")}>'
+        '<w:hyperlink r:id="rId9"><w:r><w:t>link</w:t></w:r></w:hyperlink>'
+        '<w:ins w:id="1" w:author="x"><w:r><w:t>inserted</w:t></w:r></w:ins>'
+        '<w:smartTag w:uri="u" w:element="e"><w:r><w:t>tagged</w:t></w:r></w:smartTag>'
+        '<w:r><w:t xml:space="preserve"> end </w:t></w:r>'
+        '</w:p>'
+    ))
+
+    for paragraph in document.paragraphs:
+        assert _paragraph_text(paragraph._p) == paragraph.text
+
+
+def test_table_rows_repeat_merged_cells_like_row_cells():
+    """Vertical and horizontal merges repeat the origin cell's text"""
+    document = docx.Document()
+    table = document.add_table(rows=3, cols=3)
+    for r, row in enumerate(table.rows):
+        for c, cell in enumerate(row.cells):
+            cell.text = f"r{r}c{c}"
+    table.cell(0, 0).merge(table.cell(2, 0))
+    table.cell(1, 1).merge(table.cell(2, 2))
+
+    expected = [[cell.text.strip() for cell in row.cells] for row in table.rows]
+
+    assert _table_rows(table._tbl) == expected
+    assert expected[2][0] == expected[0][0]
@@ -0,0 +1,69 @@
+#backend/tests/test_excel_processor.py
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from app.core.processors.excel_processor import ExcelProcessor
+
+
+def test_blank_sheet_does_not_abort_workbook(tmp_path):
+    """A blank worksheet must not crash the calamine reader (Rust panic)"""
+    path = tmp_path / "blank_sheet.xlsx"
+    workbook = openpyxl.Workbook()
+    data = workbook.active
+    data.title = "data"
+    data.append(["a", "b"])
+    data.append([1, 2])
+    workbook.create_sheet("empty")
+    workbook.save(path)
+    
+    result = ExcelProcessor().process(str(path))
+    
+    assert result.success, result.error_message
+    assert result.sheet_names == ["data"]
+    assert result.dataframes[0].columns.tolist() == ["a", "b"]
+    assert result.dataframes[0].iloc[0].tolist() == [1, 2]
+
+
+def test_lazy_sheets_materialize_in_iter_sheets(tmp_path):
+    """lazy=True keeps pyarrow Tables, but iter_sheets hands out DataFrames"""
+    pytest.importorskip("pyarrow")
+    import pandas as pd
+    
+    path = tmp_path / "lazy.xlsx"
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["name", "value"])
+    workbook.active.append(["x", 1.5])
+    workbook.save(path)
+    
+    result = ExcelProcessor().process(str(path), lazy=True)
+    
+    assert result.success, result.error_message
+    sheets = list(result.iter_sheets())
+    assert len(sheets) == 1
+    df = sheets[0][1]
+    assert isinstance(df, pd.DataFrame)
+    assert df.columns.tolist() == ["name", "value"]
+    assert df.to_dict("records") == [{"name": "x", "value": 1.5}]
+
+
+@pytest.mark.parametrize("header, skiprows", [(1, 0), (0, 1), (2, 0)])
+def test_apply_header_matches_read_excel(tmp_path, header, skiprows):
+    """Blank and duplicate header cells and skiprows give pd.read_excel's names and dtypes"""
+    import pandas as pd
+    from pandas.testing import assert_frame_equal
+    
+    path = tmp_path / "header.xlsx"
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["title"])
+    sheet.append([None, "name", "name", 0, "mixed"])
+    for i in range(4):
+        sheet.append([i, "x", "y", i * 1.5, 5 if i % 2 else 2.5])
+    workbook.save(path)
+    
+    raw = pd.read_excel(path, header=None, skiprows=skiprows)
+    ours = ExcelProcessor()._apply_header(raw, header)
+    
+    assert_frame_equal(ours, pd.read_excel(path, header=header, skiprows=skiprows))
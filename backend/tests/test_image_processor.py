@@ -0,0 +1,35 @@
+#backend/tests/test_image_processor.py
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from app.core.processors import image_processor
+from app.core.processors.image_processor import ImageProcessor
+
+
+@pytest.fixture
+def empty_image_cache(monkeypatch):
+    monkeypatch.setattr(ImageProcessor, "_image_cache", type(ImageProcessor._image_cache)())
+    monkeypatch.setattr(ImageProcessor, "_image_cache_bytes", 0)
+    monkeypatch.setattr(image_processor, "DECODED_IMAGE_CACHE_BYTES", 3 * 100 * 100 * 3)
+
+
+def test_decoded_image_cache_is_bounded_by_bytes(tmp_path, empty_image_cache):
+    """Images over the byte budget are not kept, and older entries are evicted"""
+    processor = ImageProcessor()
+    small = []
+    for i in range(4):
+        path = tmp_path / f"small_{i}.png"
+        Image.new("RGB", (100, 100), (i, i, i)).save(path)
+        small.append(str(path))
+    large = tmp_path / "large.png"
+    Image.new("RGB", (400, 400)).save(large)
+    
+    for path in small:
+        assert processor._load_image(path).size == (100, 100)
+    assert processor._load_image(str(large)).size == (400, 400)
+    
+    cached = [key[0] for key in ImageProcessor._image_cache]
+    assert cached == small[1:]
+    assert ImageProcessor._image_cache_bytes == 3 * 100 * 100 * 3
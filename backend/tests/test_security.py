@@ -0,0 +1,31 @@
+#backend/tests/test_security.py
+
+import pytest
+
+pytest.importorskip("bcrypt")
+pytest.importorskip("jose")
+
+from app.core.security import get_password_hash, verify_password
+
+# Generated with passlib 1.7.4: CryptContext(schemes=["bcrypt"]).hash(...)
+PASSLIB_HASH = "$2b$12$3Wz24wvYb3lEVgFWQbt13Opr3MYqyPR51FX4cZ5juUMEZvAFWT.qe"
+PASSLIB_LONG_HASH = "$2b$12$EVRfT2CAmDakL0yPBnjd7OfJHLvmk7LodtGeTCsWZ9UdXZnoMKTNC"
+
+
+def test_passlib_hashes_still_verify():
+    """Hashes stored while passlib was in use keep working"""
+    assert verify_password("correct horse battery staple", PASSLIB_HASH)
+    assert not verify_password("correct horse battery stapler", PASSLIB_HASH)
+
+
+def test_long_password_matches_its_72_byte_prefix():
+    """Like passlib, bcrypt input is truncated to 72 bytes rather than rejected"""
+    # PASSLIB_LONG_HASH is passlib's hash of "p" * 72 + "tail-ignored"
+    assert verify_password("p" * 72, PASSLIB_LONG_HASH)
+    assert verify_password("p" * 72 + "anything else", PASSLIB_LONG_HASH)
+    assert not verify_password("p" * 71, PASSLIB_LONG_HASH)
+    
+    hashed = get_password_hash("q" * 100)
+    assert hashed.startswith("$2b$")
+    assert verify_password("q" * 72, hashed)
+    assert not verify_password("q" * 71, hashed)
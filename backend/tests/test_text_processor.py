@@ -0,0 +1,28 @@
+#backend/tests/test_text_processor.py
+
+import pytest
+
+pytest.importorskip("chardet")
+
+from app.core.processors.text_processor import TextProcessor
+
+
+def test_legacy_encoding_detected_past_the_file_head(tmp_path):
+    """Non-UTF-8 bytes after the first few KB still send the file to chardet"""
+    path = tmp_path / "late_accents.txt"
+    accented = "café crème résumé\n" * 5
+    path.write_bytes(("plain ascii line\n" * 400 + accented).encode("cp1252"))
+    
+    processor = TextProcessor()
+    encoding = processor._detect_encoding(str(path))
+    
+    assert encoding.lower() == "windows-1252"
+    assert path.read_bytes().decode(encoding).endswith(accented)
+
+
+def test_utf8_file_detected_as_utf8(tmp_path):
+    """Valid UTF-8 skips chardet"""
+    path = tmp_path / "utf8.txt"
+    path.write_bytes(("plain ascii line\n" * 400 + "café crème\n").encode("utf-8"))
+    
+    assert TextProcessor()._detect_encoding(str(path)) == "utf-8"
@@ -0,0 +1,58 @@
+#backend/tests/test_zip_processor.py
+
+import io
+import os
+import zipfile
+
+from app.config import settings
+from app.core.processors.zip_processor import ZIP_RATIO_CHECK_MIN_SIZE, ZipProcessor
+
+
+def _write_zip(path, entries):
+    """Build a deflated archive in memory and write it out"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in entries.items():
+            archive.writestr(name, data)
+    path.write_bytes(buffer.getvalue())
+    return str(path)
+
+
+def test_rejects_archive_over_total_uncompressed_size(tmp_path, monkeypatch):
+    """Declared sizes above ZIP_MAX_UNCOMPRESSED_SIZE fail before extraction"""
+    monkeypatch.setattr(settings, "ZIP_MAX_UNCOMPRESSED_SIZE", 10_000)
+    path = _write_zip(tmp_path / "big.zip", {
+        "a.csv": b"x,y\n" + os.urandom(3000).hex().encode(),
+        "b.csv": b"x,y\n" + os.urandom(3000).hex().encode(),
+    })
+    
+    result = ZipProcessor().process(path)
+    
+    assert not result.success
+    assert result.error_message.startswith("Error extracting zip: Zip expands to")
+
+
+def test_rejects_large_entry_over_compression_ratio(tmp_path):
+    """An entry of 1MB or more compressed past ZIP_MAX_COMPRESSION_RATIO is a bomb"""
+    path = _write_zip(tmp_path / "bomb.zip", {"zeros.bin": b"\0" * (2 * ZIP_RATIO_CHECK_MIN_SIZE)})
+    
+    result = ZipProcessor().process(path)
+    
+    assert not result.success
+    assert result.error_message.startswith("Error extracting zip: Zip entry zeros.bin has a suspicious compression ratio")
+
+
+def test_accepts_small_entry_with_high_compression_ratio(tmp_path):
+    """Entries under 1MB are exempt from the ratio check"""
+    data = b"a,b\n" + b"1,2\n" * 100_000
+    assert len(data) < ZIP_RATIO_CHECK_MIN_SIZE
+    path = _write_zip(tmp_path / "sparse.zip", {"sparse.csv": data})
+    
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo("sparse.csv")
+    assert info.file_size / info.compress_size > settings.ZIP_MAX_COMPRESSION_RATIO
+    
+    result = ZipProcessor().process(path)
+    
+    assert result.success, result.error_message
+    assert result.dataframes[0].shape == (100_000, 2)